@@ -124,7 +124,7 @@ async def get_secret(request: Request, secret_id: int, db: Session = Depends(get
     Raises:
         404 Not Found: If secret doesn't exist
     """
-    secret = db.query(Secret).filter(Secret.id == secret_id).first()
+    secret = db.get(Secret, secret_id)
 
     if not secret:
         logger.warning(f"Secret not found: {secret_id}")
@@ -161,7 +161,7 @@ async def delete_secret(request: Request, secret_id: int, db: Session = Depends(
         404 Not Found: If secret doesn't exist
         409 Conflict: If secret is referenced by active jobs
     """
-    secret = db.query(Secret).filter(Secret.id == secret_id).first()
+    secret = db.get(Secret, secret_id)
 
     if not secret:
         logger.warning(f"Attempted to delete non-existent secret: {secret_id}")
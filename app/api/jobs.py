@@ -4,6 +4,7 @@ import logging
 from datetime import datetime, timezone
 from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from app.database import get_db
@@ -88,20 +89,16 @@ async def create_job(request: Request, job_data: PollingJobCreate, db: Session =
     )
 
     db.add(job)
-    db.commit()
-    db.refresh(job)
-
-    # Create JobBatch records for each batch_id
-    for batch_id in job_data.batch_ids:
-        batch = JobBatch(
-            job_id=job.id,
-            batch_id=batch_id,
-            status="in_progress",
-        )
-        db.add(batch)
-
-    db.commit()
-    db.refresh(job)
+    db.flush()  # Assigns job.id without ending the transaction
+
+    # Create JobBatch records for all batch_ids in a single INSERT
+    db.execute(
+        insert(JobBatch),
+        [
+            {"job_id": job.id, "batch_id": batch_id, "status": "in_progress"}
+            for batch_id in job_data.batch_ids
+        ],
+    )
 
     # Create initial log entry
     batch_ids_str = ", ".join(job_data.batch_ids)
@@ -112,7 +109,10 @@ async def create_job(request: Request, job_data: PollingJobCreate, db: Session =
         f"Poll interval: {job.poll_interval_seconds}s",
     )
     db.add(log)
+
+    # Job, batches and log are committed together
     db.commit()
+    db.refresh(job)
 
     # Add secret names to the response
     job.openai_secret_name = openai_secret.name
@@ -143,7 +143,7 @@ async def list_jobs(
     """
     List all polling jobs with batches array and computed counts.
 
-    Batches are eager-loaded via lazy="joined" in model relationship.
+    Batches are eager-loaded via lazy="selectin" in model relationship.
 
     Args:
         status_filter: Optional status filter
@@ -194,7 +194,7 @@ async def get_job(
     Raises:
         404 Not Found: If job doesn't exist
     """
-    job = db.query(PollingJob).filter(PollingJob.id == job_id).first()
+    job = db.get(PollingJob, job_id)
 
     if not job:
         raise HTTPException(
@@ -222,22 +222,20 @@ async def get_job(
             .all()
         )
 
-    # Get batches (eager-loaded via lazy="joined")
+    # Get batches (eager-loaded via lazy="selectin")
     batches = job.batches if hasattr(job, "batches") else []
 
-    # Compute batch statistics
-    batch_count = len(batches)
-    completed_count = sum(1 for b in batches if b.status == "completed")
-    failed_count = sum(1 for b in batches if b.status in {"failed", "cancelled", "expired"})
+    # Compute batch statistics in one pass over the batches
+    summary = job.batch_completion_summary
 
     # Build response dict with all fields
     job_dict = {
         "id": job.id,
         "name": job.name,
         "batches": batches,
-        "batch_count": batch_count,
-        "completed_count": completed_count,
-        "failed_count": failed_count,
+        "batch_count": summary["total"],
+        "completed_count": summary["completed"],
+        "failed_count": summary["failed"],
         "openai_secret_id": job.openai_secret_id,
         "openai_secret_name": openai_secret.name if openai_secret else None,
         "keboola_secret_id": job.keboola_secret_id,
@@ -281,7 +279,7 @@ async def update_job(request: Request, job_id: int, job_update: PollingJobUpdate
     Raises:
         404 Not Found: If job doesn't exist
     """
-    job = db.query(PollingJob).filter(PollingJob.id == job_id).first()
+    job = db.get(PollingJob, job_id)
 
     if not job:
         raise HTTPException(
@@ -339,7 +337,7 @@ async def delete_job(request: Request, job_id: int, db: Session = Depends(get_db
     Raises:
         404 Not Found: If job doesn't exist
     """
-    job = db.query(PollingJob).filter(PollingJob.id == job_id).first()
+    job = db.get(PollingJob, job_id)
 
     if not job:
         raise HTTPException(
@@ -378,7 +376,7 @@ async def pause_job(request: Request, job_id: int, db: Session = Depends(get_db)
         404 Not Found: If job doesn't exist
         409 Conflict: If job is not active
     """
-    job = db.query(PollingJob).filter(PollingJob.id == job_id).first()
+    job = db.get(PollingJob, job_id)
 
     if not job:
         raise HTTPException(
@@ -435,7 +433,7 @@ async def resume_job(request: Request, job_id: int, db: Session = Depends(get_db
         404 Not Found: If job doesn't exist
         409 Conflict: If job is not paused
     """
-    job = db.query(PollingJob).filter(PollingJob.id == job_id).first()
+    job = db.get(PollingJob, job_id)
 
     if not job:
         raise HTTPException(
@@ -452,6 +450,7 @@ async def resume_job(request: Request, job_id: int, db: Session = Depends(get_db
 
     job.status = "active"
     job.next_check_at = datetime.now(timezone.utc)  # Schedule immediate check
+    job.unchanged_checks = 0  # Restart the idle backoff
     db.commit()
     db.refresh(job)
 
@@ -2,9 +2,9 @@
 Database connection and session management using SQLAlchemy.
 """
 
-from typing import Generator
+from typing import Generator, Optional, Union
 from sqlalchemy import create_engine, event
-from sqlalchemy.engine import Engine
+from sqlalchemy.engine import Connection, Engine
 from sqlalchemy.orm import sessionmaker, Session, DeclarativeBase
 from sqlalchemy.pool import StaticPool
 
@@ -69,27 +69,33 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
-def init_db() -> None:
+def init_db(bind: Optional[Union[Engine, Connection]] = None) -> None:
     """
     Initialize the database by creating all tables.
     This should be called during application startup.
+
+    Args:
+        bind: Optional engine or open connection to use (defaults to the global engine)
     """
     # Import models to ensure they're registered
     from app import models  # noqa: F401
 
     # Create all tables
-    Base.metadata.create_all(bind=engine)
+    Base.metadata.create_all(bind=bind if bind is not None else engine)
 
 
-def drop_db() -> None:
+def drop_db(bind: Optional[Union[Engine, Connection]] = None) -> None:
     """
     Drop all database tables.
     WARNING: This will delete all data!
     Use only for testing or complete reset.
+
+    Args:
+        bind: Optional engine or open connection to use (defaults to the global engine)
     """
     from app import models  # noqa: F401
 
-    Base.metadata.drop_all(bind=engine)
+    Base.metadata.drop_all(bind=bind if bind is not None else engine)
 
 
 def reset_db() -> None:
@@ -11,6 +11,14 @@ import logging
 from typing import Optional, Dict, Any
 import aiohttp
 
+try:
+    import orjson
+
+    _json_dumps_bytes = orjson.dumps
+except ImportError:  # orjson is optional; fall back to the stdlib
+    def _json_dumps_bytes(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
 logger = logging.getLogger(__name__)
 
 
@@ -31,17 +39,33 @@ class KeboolaClient:
     # Request timeout
     REQUEST_TIMEOUT = 30  # seconds
 
-    def __init__(self, storage_api_token: str, stack_url: str):
+    def __init__(
+        self,
+        storage_api_token: str,
+        stack_url: str,
+        session: Optional[aiohttp.ClientSession] = None,
+    ):
         """
         Initialize the Keboola Connection client.
 
         Args:
             storage_api_token: Keboola Storage API token for authentication
             stack_url: Base URL of the Keboola stack (e.g., https://connection.keboola.com)
+            session: Optional shared HTTP session (owned and closed by the caller).
+                     If omitted, the client creates its own on first request.
         """
         self.storage_api_token = storage_api_token
         self.stack_url = stack_url.rstrip("/")  # Remove trailing slash if present
         self._token_preview = storage_api_token[:8] + "..." if len(storage_api_token) > 8 else "***"
+        self._session = session
+        self._owns_session = session is None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the HTTP session, creating an owned one on first use."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession()
+            self._owns_session = True
+        return self._session
 
     async def trigger_job(
         self,
@@ -187,10 +211,10 @@ class KeboolaClient:
         queue_url = self.stack_url.replace("connection", "queue")
         endpoint = f"{queue_url}/jobs"
 
-        # Prepare headers
-        # Note: Don't set Content-Type - aiohttp sets it automatically for JSON
+        # Prepare headers (the body is pre-encoded, so Content-Type is set here)
         headers = {
             "X-StorageApi-Token": self.storage_api_token,
+            "Content-Type": "application/json",
         }
 
         # Prepare payload with the correct format
@@ -233,25 +257,27 @@ class KeboolaClient:
         # Create timeout
         timeout = aiohttp.ClientTimeout(total=self.REQUEST_TIMEOUT)
 
-        # Execute the request
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            async with session.post(endpoint, json=payload, headers=headers) as response:
-                # Log response status
-                logger.info(f"Keboola API Response Status: {response.status}")
+        # Execute the request (reusing pooled connections)
+        session = self._get_session()
+        async with session.post(
+            endpoint, data=_json_dumps_bytes(payload), headers=headers, timeout=timeout
+        ) as response:
+            # Log response status
+            logger.info(f"Keboola API Response Status: {response.status}")
 
-                # Read response text for error logging
-                response_text = await response.text()
+            # Read response text for error logging
+            response_text = await response.text()
 
-                # Raise for HTTP errors
-                if response.status >= 400:
-                    logger.error(f"Keboola API Error Response: {response_text}")
-                    response.raise_for_status()
+            # Raise for HTTP errors
+            if response.status >= 400:
+                logger.error(f"Keboola API Error Response: {response_text}")
+                response.raise_for_status()
 
-                # Parse response
-                data = json.loads(response_text)
+            # Parse response
+            data = json.loads(response_text)
 
-                # Parse and normalize the response
-                return self._parse_job_response(data, configuration_id)
+            # Parse and normalize the response
+            return self._parse_job_response(data, configuration_id)
 
     def _parse_job_response(self, data: Dict[str, Any], configuration_id: str) -> Dict[str, Any]:
         """
@@ -324,21 +350,21 @@ class KeboolaClient:
 
         timeout = aiohttp.ClientTimeout(total=self.REQUEST_TIMEOUT)
 
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            async with session.get(endpoint, headers=headers) as response:
-                response.raise_for_status()
-                data = await response.json()
-
-                return {
-                    "job_id": str(data.get("id")),
-                    "status": data.get("status"),
-                    "created_time": data.get("createdTime"),
-                    "start_time": data.get("startTime"),
-                    "end_time": data.get("endTime"),
-                    "duration_seconds": data.get("durationSeconds"),
-                    "is_finished": data.get("isFinished", False),
-                    "url": data.get("url"),
-                }
+        session = self._get_session()
+        async with session.get(endpoint, headers=headers, timeout=timeout) as response:
+            response.raise_for_status()
+            data = await response.json()
+
+            return {
+                "job_id": str(data.get("id")),
+                "status": data.get("status"),
+                "created_time": data.get("createdTime"),
+                "start_time": data.get("startTime"),
+                "end_time": data.get("endTime"),
+                "duration_seconds": data.get("durationSeconds"),
+                "is_finished": data.get("isFinished", False),
+                "url": data.get("url"),
+            }
 
     def is_job_finished(self, status: str) -> bool:
         """
@@ -365,6 +391,18 @@ class KeboolaClient:
         """
         return status.lower() == "success"
 
+    async def close(self):
+        """
+        Close the HTTP session if this client created it.
+        """
+        if self._owns_session and self._session is not None:
+            try:
+                await self._session.close()
+                logger.info("Keboola client session closed successfully")
+            except Exception as e:
+                logger.warning(f"Error closing Keboola client session: {e}")
+        self._session = None
+
     def __repr__(self) -> str:
         """String representation with redacted API token."""
         return f"KeboolaClient(stack_url={self.stack_url}, token={self._token_preview})"
@@ -7,10 +7,12 @@ with proper error handling, retries, and exponential backoff.
 
 import asyncio
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Iterable, Optional
 
 from openai import AsyncOpenAI, OpenAIError, APIError, RateLimitError, APIConnectionError
 
+from app.models import JobBatch
+
 logger = logging.getLogger(__name__)
 
 
@@ -27,6 +29,12 @@ class OpenAIBatchClient:
     MAX_RETRY_DELAY = 60  # seconds
     RETRY_MULTIPLIER = 2
 
+    # Page size for list_batch_statuses (OpenAI allows up to 100)
+    LIST_PAGE_SIZE = 100
+
+    # Statuses after which a batch no longer changes (shared with the model)
+    TERMINAL_STATUSES = JobBatch.TERMINAL_STATUSES
+
     # Valid batch statuses from OpenAI API
     VALID_STATUSES = {
         "validating",
@@ -143,6 +151,38 @@ class OpenAIBatchClient:
             else OpenAIError("Failed to check batch status after all retries")
         )
 
+    async def list_batch_statuses(
+        self, batch_ids: Optional[Iterable[str]] = None, limit: int = LIST_PAGE_SIZE
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch statuses of the most recent batches with a single list request.
+
+        Only one page is fetched and there are no retries: batches that are
+        not among the most recent ones (or a failed request) should be
+        resolved with check_batch_status instead.
+
+        Args:
+            batch_ids: Optional IDs to keep; only these are parsed
+            limit: Number of recent batches to list (max 100)
+
+        Returns:
+            Mapping of batch ID to the same dictionary check_batch_status returns
+
+        Raises:
+            OpenAIError: If the list request fails
+        """
+        wanted = set(batch_ids) if batch_ids is not None else None
+
+        page = await self.client.batches.list(limit=limit)
+
+        results = {}
+        for batch in page.data:
+            if wanted is None or batch.id in wanted:
+                results[batch.id] = self._parse_batch_response(batch)
+
+        logger.info(f"Listed {len(page.data)} recent batches, {len(results)} requested")
+        return results
+
     def _parse_batch_response(self, batch: Any) -> Dict[str, Any]:
         """
         Parse the batch response from OpenAI API.
@@ -220,8 +260,7 @@ class OpenAIBatchClient:
         Returns:
             True if status is terminal, False otherwise
         """
-        terminal_statuses = {"completed", "failed", "expired", "cancelled"}
-        return status.lower() in terminal_statuses
+        return status.lower() in self.TERMINAL_STATUSES
 
     def is_success_status(self, status: str) -> bool:
         """
@@ -21,6 +21,12 @@ from app.web import router as web_router
 from fastapi.staticfiles import StaticFiles
 from pathlib import Path
 
+try:
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse as DefaultResponse
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    DefaultResponse = JSONResponse
+
 
 # Load settings early for logging configuration
 settings = get_settings()
@@ -117,6 +123,7 @@ app = FastAPI(
     version=settings.api_version,
     description=settings.api_description,
     lifespan=lifespan,
+    default_response_class=DefaultResponse,
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json",
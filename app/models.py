@@ -6,6 +6,7 @@ Defines the database schema for secrets, polling jobs, and polling logs.
 from datetime import datetime, timezone
 from typing import Optional
 from sqlalchemy import Integer, String, Text, DateTime, ForeignKey, Index, CheckConstraint
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
@@ -89,7 +90,8 @@ class JobBatch(Base):
     __table_args__ = (
         Index("idx_batch_job_id", "job_id"),
         Index("idx_batch_batch_id", "batch_id"),
-        Index("idx_batch_status", "status"),
+        # Covering index: status filters per job resolve without table lookups
+        Index("idx_batch_status_job", "status", "job_id", "batch_id"),
         # Ensure no duplicate batch_ids within same job
         Index("idx_batch_job_batch_unique", "job_id", "batch_id", unique=True),
         # Check constraint for format (SQLite 3.38+)
@@ -110,20 +112,40 @@ class JobBatch(Base):
             f"batch_id='{self.batch_id}', status='{self.status}')>"
         )
 
-    @property
+    TERMINAL_STATUSES = frozenset({"completed", "failed", "cancelled", "expired"})
+    FAILED_STATUSES = frozenset({"failed", "cancelled", "expired"})
+
+    # Hybrid properties: plain checks on instances, SQL expressions on the class
+    # (e.g. select(JobBatch).where(JobBatch.is_terminal))
+    @hybrid_property
     def is_terminal(self) -> bool:
         """Check if batch is in terminal state (completed, failed, cancelled, expired)."""
-        return self.status in {"completed", "failed", "cancelled", "expired"}
+        return self.status in self.TERMINAL_STATUSES
 
-    @property
+    @is_terminal.inplace.expression
+    @classmethod
+    def _is_terminal_expression(cls):
+        return cls.status.in_(sorted(cls.TERMINAL_STATUSES))
+
+    @hybrid_property
     def is_completed(self) -> bool:
         """Check if batch completed successfully."""
         return self.status == "completed"
 
-    @property
+    @is_completed.inplace.expression
+    @classmethod
+    def _is_completed_expression(cls):
+        return cls.status == "completed"
+
+    @hybrid_property
     def is_failed(self) -> bool:
         """Check if batch failed (any terminal state except completed)."""
-        return self.status in {"failed", "cancelled", "expired"}
+        return self.status in self.FAILED_STATUSES
+
+    @is_failed.inplace.expression
+    @classmethod
+    def _is_failed_expression(cls):
+        return cls.status.in_(sorted(cls.FAILED_STATUSES))
 
 
 class PollingJob(Base):
@@ -143,6 +165,8 @@ class PollingJob(Base):
         keboola_configuration_id: Keboola configuration to trigger
         poll_interval_seconds: How often to check status (in seconds)
         status: Current job status ('active', 'paused', 'completed', 'failed', 'completed_with_failures')
+        unchanged_checks: Consecutive checks that found no batch status change
+            (drives the scheduler's idle backoff)
         last_check_at: When the job was last checked
         next_check_at: When the job should be checked next
         created_at: When the job was created
@@ -172,6 +196,9 @@ class PollingJob(Base):
 
     # Job status
     status: Mapped[str] = mapped_column(String(50), nullable=False, default="active", index=True)
+    unchanged_checks: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
 
     # Timestamps
     last_check_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
@@ -200,7 +227,9 @@ class PollingJob(Base):
         back_populates="job",
         cascade="all, delete-orphan",
         order_by="JobBatch.created_at",
-        lazy="joined",  # Eager loading to avoid N+1 queries
+        # selectin: one extra IN query per load, no parent-row duplication and no
+        # LIMIT subquery wrapping for .first() as joined eager loading needs
+        lazy="selectin",
     )
 
     # Indexes for common queries
@@ -255,12 +284,25 @@ class PollingJob(Base):
 
     @property
     def batch_completion_summary(self) -> dict:
-        """Get summary of batch completion status."""
+        """Get summary of batch completion status (single pass over batches)."""
+        return self.summarize_batch_statuses(batch.status for batch in self.batches)
+
+    @staticmethod
+    def summarize_batch_statuses(statuses) -> dict:
+        """Count completed/failed/in-progress batches from an iterable of statuses."""
+        total = completed = failed = 0
+        for status in statuses:
+            total += 1
+            if status == "completed":
+                completed += 1
+            elif status in JobBatch.FAILED_STATUSES:
+                failed += 1
+
         return {
-            "total": len(self.batches),
-            "completed": len(self.completed_batches),
-            "failed": len(self.failed_batches),
-            "in_progress": len([b for b in self.batches if not b.is_terminal]),
+            "total": total,
+            "completed": completed,
+            "failed": failed,
+            "in_progress": total - completed - failed,
         }
 
 
@@ -1,5 +1,6 @@
 """Pydantic schemas for request validation and response serialization."""
 
+import re
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 from pydantic import BaseModel, Field, field_validator
@@ -60,6 +61,10 @@ class JobBatchSchema(BaseModel):
     model_config = {"from_attributes": True}
 
 
+# Character whitelist for batch IDs, compiled once at import
+_BATCH_ID_CHARS_RE = re.compile(r"[A-Za-z0-9_-]+")
+
+
 class PollingJobCreate(BaseModel):
     """
     Schema for creating a new polling job.
@@ -88,10 +93,13 @@ class PollingJobCreate(BaseModel):
         - Character whitelist: [a-zA-Z0-9_-]
         - Max 255 chars per ID
         """
-        if len(v) != len(set(v)):
-            raise ValueError("Duplicate batch IDs are not allowed")
-
+        seen = set()
         for batch_id in v:
+            # Duplicates are detected in the same pass as the format checks
+            if batch_id in seen:
+                raise ValueError("Duplicate batch IDs are not allowed")
+            seen.add(batch_id)
+
             # Format validation
             if not batch_id.startswith("batch_"):
                 raise ValueError(
@@ -99,8 +107,7 @@ class PollingJobCreate(BaseModel):
                 )
 
             # Character whitelist (prevents injection attacks)
-            allowed_chars = set("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_-")
-            if not all(c in allowed_chars for c in batch_id):
+            if not _BATCH_ID_CHARS_RE.fullmatch(batch_id):
                 raise ValueError(
                     f"Batch ID '{batch_id}' contains invalid characters. "
                     f"Only alphanumeric, underscore, and hyphen allowed."
@@ -173,21 +180,17 @@ class PollingJobResponse(BaseModel):
         # Get batches list
         batches = obj.batches if hasattr(obj, "batches") else []
 
-        # Compute statistics
-        batch_count = len(batches)
-        completed_count = sum(1 for b in batches if b.status == "completed")
-        failed_count = sum(
-            1 for b in batches if b.status in {"failed", "cancelled", "expired"}
-        )
+        # Compute statistics in one pass over the batches
+        summary = obj.batch_completion_summary
 
         # Build response dict
         data = {
             "id": obj.id,
             "name": obj.name,
             "batches": batches,
-            "batch_count": batch_count,
-            "completed_count": completed_count,
-            "failed_count": failed_count,
+            "batch_count": summary["total"],
+            "completed_count": summary["completed"],
+            "failed_count": summary["failed"],
             "openai_secret_id": obj.openai_secret_id,
             "openai_secret_name": getattr(obj, "openai_secret_name", None),
             "keboola_secret_id": obj.keboola_secret_id,
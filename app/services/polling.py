@@ -7,10 +7,11 @@ Keboola jobs upon completion. Handles concurrent polling with asyncio.
 
 import asyncio
 import logging
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Set
 from datetime import datetime, timezone
 from contextlib import contextmanager
 
+import aiohttp
 
 from app.integrations.openai_client import OpenAIBatchClient
 from app.integrations.keboola_client import KeboolaClient
@@ -34,6 +35,13 @@ class PollingService:
     DEFAULT_SLEEP_SECONDS = 5  # Default sleep if no jobs scheduled
     MAX_CONCURRENT_CHECKS = 10  # Maximum concurrent status checks
     POLL_BATCH_SIZE = 50  # Number of jobs to process in each iteration
+    STATUS_FLUSH_SIZE = 5  # Batch status changes written per UPDATE
+    LIST_MIN_BATCHES = 4  # Fewer pending batches are retrieved individually
+
+    # Connection pool for the shared Keboola HTTP session
+    HTTP_CONNECTION_LIMIT = 20
+    HTTP_CONNECTION_LIMIT_PER_HOST = 10
+    HTTP_KEEPALIVE_TIMEOUT = 60  # seconds
 
     def __init__(
         self,
@@ -60,6 +68,18 @@ class PollingService:
         self._openai_clients: Dict[int, OpenAIBatchClient] = {}
         self._keboola_clients: Dict[int, KeboolaClient] = {}
 
+        # HTTP session shared by all Keboola clients, created on first use
+        self._http_session: Optional[aiohttp.ClientSession] = None
+
+        # Bounds OpenAI status checks across all jobs, created on first use
+        self._batch_semaphore: Optional[asyncio.Semaphore] = None
+
+        # One OpenAI batch listing per secret, shared by the jobs of a cycle
+        self._batch_listings: Dict[int, asyncio.Task] = {}
+
+        # Jobs with batches older than a listing reaches; checked individually
+        self._unlisted_jobs: Set[int] = set()
+
         logger.info(
             f"PollingService initialized with max_concurrent_checks={self.max_concurrent_checks}, "
             f"default_poll_interval={self.default_poll_interval}s"
@@ -88,6 +108,9 @@ class PollingService:
                     with self._create_db_session() as db:
                         scheduler = JobScheduler(db)
 
+                        # Paused, finished or deleted jobs get a fresh listing attempt
+                        self._prune_unlisted_jobs(db)
+
                         # Get jobs that need checking
                         jobs_to_check = scheduler.get_jobs_to_check(limit=self.POLL_BATCH_SIZE)
 
@@ -135,7 +158,11 @@ class PollingService:
 
         # Process all jobs concurrently (limited by semaphore)
         tasks = [process_with_semaphore(job) for job in jobs]
-        await asyncio.gather(*tasks, return_exceptions=True)
+        try:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            # Listings are only fresh for the cycle that fetched them
+            self._batch_listings.clear()
 
     async def _process_single_job(self, job: Any) -> None:
         """
@@ -163,88 +190,274 @@ class PollingService:
             batches_to_check = [b for b in job.batches if not b.is_terminal]
 
             if not batches_to_check:
-                # All already terminal - shouldn't happen, but handle gracefully
+                # All already terminal (e.g. a crash before the job was marked
+                # completed) - trigger if needed and finish the job
                 if job.all_batches_terminal and job.status == "active":
                     await self._trigger_keboola_with_results(job)
+                    self._finish_job(job_id, has_failures=bool(job.failed_batches))
                 return
 
             logger.info(f"Job {job_id}: Checking {len(batches_to_check)} non-terminal batches")
 
-            # Process batches concurrently (respects semaphore limit)
-            check_tasks = [
-                self._check_single_batch(openai_client, job_batch)
+            # Process batches concurrently, bounded by max_concurrent_checks
+            # across all jobs. A separate semaphore from _process_jobs_concurrent,
+            # whose slot this job already holds.
+            batch_semaphore = self._get_batch_semaphore()
+
+            # One list request per secret resolves every batch that is recent
+            # enough; the rest fall back to individual status checks
+            prefetched = await self._prefetch_batch_statuses(
+                job, openai_client, [b.batch_id for b in batches_to_check]
+            )
+
+            async def fetch_with_semaphore(job_batch):
+                async with batch_semaphore:
+                    new_status = await self._fetch_batch_status(
+                        openai_client, job_batch, prefetched.get(job_batch.batch_id)
+                    )
+                    return job_batch, new_status
+
+            # Stream results as they arrive and write changed statuses in
+            # executemany UPDATEs of up to STATUS_FLUSH_SIZE rows, so DB writes
+            # overlap with the checks still in flight
+            fetch_tasks = [
+                asyncio.create_task(fetch_with_semaphore(job_batch))
                 for job_batch in batches_to_check
             ]
+            updates: Dict[int, str] = {}
+            updated_count = 0
+            checked_count = 0
+            try:
+                for next_done in asyncio.as_completed(fetch_tasks):
+                    try:
+                        job_batch, new_status = await next_done
+                    except Exception as e:
+                        logger.error(f"Job {job_id}: Unexpected batch check error: {e}")
+                        continue
+
+                    if new_status is None:
+                        continue
+                    checked_count += 1
+
+                    if new_status != job_batch.status:
+                        updates[job_batch.id] = new_status
+
+                    if len(updates) >= self.STATUS_FLUSH_SIZE:
+                        self._flush_batch_statuses(updates)
+                        updated_count += len(updates)
+                        updates = {}
+
+                if updates:
+                    self._flush_batch_statuses(updates)
+                    updated_count += len(updates)
+            finally:
+                for task in fetch_tasks:
+                    task.cancel()
 
-            await asyncio.gather(*check_tasks, return_exceptions=True)
+            if updated_count:
+                logger.info(f"Job {job_id}: Updated status of {updated_count} batch(es)")
 
-            # Refresh job from DB to get updated batch statuses
+            # Re-read batch statuses as plain rows; the ORM job and its batches
+            # are only loaded when all batches are terminal
             with self._create_db_session() as db:
-                from app.models import PollingJob
-                job = db.query(PollingJob).filter(PollingJob.id == job_id).first()
-                if not job:
-                    logger.error(f"Job {job_id} not found after batch checks")
-                    return
-
-                # Log current state
-                summary = job.batch_completion_summary
-                await self._log_status_check(
-                    job_id,
-                    {"status": "checking"},
-                    message=f"Batch status: {summary['completed']} completed, "
-                            f"{summary['failed']} failed, {summary['in_progress']} in progress"
-                )
+                from sqlalchemy import select
+                from sqlalchemy.orm import selectinload
+                from app.models import JobBatch, PollingJob
+
+                statuses = db.scalars(
+                    select(JobBatch.status).where(JobBatch.job_id == job_id)
+                ).all()
+                summary = PollingJob.summarize_batch_statuses(statuses)
+
+                all_terminal = summary["total"] and not summary["in_progress"]
+                if all_terminal:
+                    finished_job = db.get(
+                        PollingJob, job_id, options=[selectinload(PollingJob.batches)]
+                    )
+
+            # Log current state
+            await self._log_status_check(
+                job_id,
+                {"status": "checking"},
+                message=f"Batch status: {summary['completed']} completed, "
+                        f"{summary['failed']} failed, {summary['in_progress']} in progress"
+            )
 
-                # Check if all batches are terminal
-                if job.all_batches_terminal:
-                    await self._trigger_keboola_with_results(job)
-                    job.status = "completed_with_failures" if job.failed_batches else "completed"
-                    job.completed_at = datetime.now(timezone.utc)
-                    db.commit()
-                else:
-                    # Reschedule next check
-                    await self._reschedule_job(job)
+            if not all_terminal:
+                # Reschedule next check, backing off only while successful
+                # checks keep finding no changes (failed checks don't count)
+                await self._reschedule_job(job, backoff=bool(checked_count) and not updated_count)
+                return
+
+            if not finished_job:
+                logger.error(f"Job {job_id} not found after batch checks")
+                return
+
+            await self._trigger_keboola_with_results(finished_job)
+            self._finish_job(job_id, has_failures=bool(summary["failed"]))
 
         except Exception as e:
             logger.error(f"Error processing job {job_id}: {e}", exc_info=True)
             await self._handle_job_error(job, str(e))
 
-    async def _check_single_batch(
+    def _finish_job(self, job_id: int, has_failures: bool) -> None:
+        """
+        Mark a job whose batches are all terminal as completed.
+
+        Jobs that already left the active state are left alone, so a failed
+        Keboola trigger keeps the job marked as failed.
+
+        Args:
+            job_id: ID of the job
+            has_failures: Whether any batch failed, expired or was cancelled
+        """
+        from app.models import PollingJob  # Import here to avoid circular dependency
+
+        with self._create_db_session() as db:
+            job = db.get(PollingJob, job_id)
+            if job and job.status == "active":
+                job.status = "completed_with_failures" if has_failures else "completed"
+                job.completed_at = datetime.now(timezone.utc)
+                db.commit()
+
+    async def _prefetch_batch_statuses(
         self,
+        job: Any,
         openai_client: Any,
-        job_batch: Any
-    ) -> None:
+        batch_ids: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
         """
-        Check status of single batch and update database.
+        Resolve several batch statuses from a listing of recent batches.
+
+        The listing is fetched once per OpenAI secret per polling cycle and
+        shared by all jobs using that secret. Jobs with few pending batches
+        skip it, and once a listing misses some of a job's batches (they are
+        older than the listed page of recent batches), the job stops using listings
+        while it stays active.
+
+        Args:
+            job: Job record the batches belong to
+            openai_client: OpenAI client instance
+            batch_ids: Batch IDs that need checking
+
+        Returns:
+            Status results for the batch IDs found in the listing (may be empty)
+        """
+        if len(batch_ids) < self.LIST_MIN_BATCHES or job.id in self._unlisted_jobs:
+            return {}
+
+        listing_task = self._batch_listings.get(job.openai_secret_id)
+        if listing_task is None:
+            listing_task = asyncio.create_task(openai_client.list_batch_statuses())
+            self._batch_listings[job.openai_secret_id] = listing_task
+
+        try:
+            # Shielded so a cancelled job doesn't cancel the listing for the others
+            listing = await asyncio.shield(listing_task)
+        except Exception as e:
+            logger.warning(f"Listing batches failed, checking individually: {e}")
+            return {}
+
+        found = {batch_id: listing[batch_id] for batch_id in batch_ids if batch_id in listing}
+
+        if len(found) < len(batch_ids):
+            # Missing batches only get older, so later listings won't find them either
+            logger.info(
+                f"Job {job.id}: {len(batch_ids) - len(found)} batch(es) not in the recent "
+                f"listing, checking batches individually from now on"
+            )
+            self._unlisted_jobs.add(job.id)
+
+        return found
+
+    def _prune_unlisted_jobs(self, db: Any) -> None:
+        """
+        Forget listing misses of jobs that are no longer active.
+
+        Args:
+            db: Database session
+        """
+        if not self._unlisted_jobs:
+            return
+
+        from sqlalchemy import select
+        from app.models import PollingJob
+
+        active_ids = db.scalars(
+            select(PollingJob.id).where(
+                PollingJob.id.in_(sorted(self._unlisted_jobs)), PollingJob.status == "active"
+            )
+        ).all()
+        self._unlisted_jobs.intersection_update(active_ids)
+
+    async def _fetch_batch_status(
+        self,
+        openai_client: Any,
+        job_batch: Any,
+        status_result: Optional[Dict[str, Any]] = None
+    ) -> Optional[str]:
+        """
+        Fetch the current status of a single batch without writing it.
 
         Args:
             openai_client: OpenAI client instance
             job_batch: JobBatch instance to check
+            status_result: Already fetched status (e.g. from a batch listing);
+                the OpenAI API is only called when this is None
+
+        Returns:
+            The current status, or None when the check failed (the error is logged)
         """
         try:
-            status_result = await openai_client.check_batch_status(job_batch.batch_id)
+            if status_result is None:
+                status_result = await openai_client.check_batch_status(job_batch.batch_id)
             new_status = status_result["status"]
 
             logger.debug(f"Batch {job_batch.batch_id}: status '{new_status}'")
 
-            if new_status != job_batch.status:
-                with self._create_db_session() as db:
-                    from app.models import JobBatch
+            return new_status
 
-                    # Get fresh batch instance from this session
-                    batch = db.query(JobBatch).filter(JobBatch.id == job_batch.id).first()
-                    if batch:
-                        batch.status = new_status
+        except Exception as e:
+            error_message = f"Failed to check batch {job_batch.batch_id}: {str(e)}"
+            logger.error(error_message, exc_info=True)
+            await self._log_error(job_batch.job_id, error_message)
+            return None
 
-                        if batch.is_terminal:
-                            batch.completed_at = datetime.now(timezone.utc)
+    def _flush_batch_statuses(self, updates: Dict[int, str]) -> None:
+        """
+        Write and commit a group of batch status changes.
 
-                        db.commit()
-                        logger.info(f"Batch {job_batch.batch_id}: status updated to '{new_status}'")
+        Args:
+            updates: Mapping of JobBatch.id to its new status
+        """
+        with self._create_db_session() as db:
+            self._apply_batch_statuses(db, updates)
+            db.commit()
 
-        except Exception as e:
-            logger.error(f"Failed to check batch {job_batch.batch_id}: {str(e)}", exc_info=True)
-            await self._log_error(job_batch.job_id, f"Failed to check batch {job_batch.batch_id}: {str(e)}")
+    @staticmethod
+    def _apply_batch_statuses(db: Any, updates: Dict[int, str]) -> None:
+        """
+        Write new batch statuses with a single bulk UPDATE (caller commits).
+
+        Args:
+            db: Database session
+            updates: Mapping of JobBatch.id to its new status
+        """
+        from sqlalchemy import update
+        from app.models import JobBatch
+
+        now = datetime.now(timezone.utc)
+        db.execute(
+            update(JobBatch),
+            [
+                {
+                    "id": batch_pk,
+                    "status": new_status,
+                    "completed_at": now if new_status in JobBatch.TERMINAL_STATUSES else None,
+                }
+                for batch_pk, new_status in updates.items()
+            ],
+        )
 
     async def _trigger_keboola_with_results(self, job: Any) -> None:
         """
@@ -263,14 +476,26 @@ class PollingService:
         job_id = job.id
 
         try:
+            # A logged trigger is the idempotency key: never fire twice for a job
+            if self._keboola_already_triggered(job_id):
+                logger.warning(f"Job {job_id}: Keboola job already triggered, skipping")
+                return
+
             logger.info(f"Job {job_id}: All batches terminal, triggering Keboola job")
 
             # Get or create Keboola client for this job
             keboola_client = await self._get_keboola_client(job)
 
-            # Prepare metadata to pass as Keboola variables
-            completed_ids = [b.batch_id for b in job.completed_batches]
-            failed_ids = [b.batch_id for b in job.failed_batches]
+            from app.models import JobBatch
+
+            # Prepare metadata to pass as Keboola variables (one pass over batches)
+            completed_ids = []
+            failed_ids = []
+            for batch in job.batches:
+                if batch.status == "completed":
+                    completed_ids.append(batch.batch_id)
+                elif batch.status in JobBatch.FAILED_STATUSES:
+                    failed_ids.append(batch.batch_id)
 
             parameters = {
                 "batch_ids_completed": completed_ids,
@@ -308,7 +533,7 @@ class PollingService:
             # Mark job as failed
             with self._create_db_session() as db:
                 from app.models import PollingJob
-                job_to_fail = db.query(PollingJob).filter(PollingJob.id == job_id).first()
+                job_to_fail = db.get(PollingJob, job_id)
                 if job_to_fail:
                     job_to_fail.status = "failed"
                     job_to_fail.completed_at = datetime.now(timezone.utc)
@@ -318,19 +543,40 @@ class PollingService:
     # _handle_batch_completion() replaced by _trigger_keboola_with_results()
     # _handle_batch_terminal() logic now handled in _process_single_job()
 
-    async def _reschedule_job(self, job: Any) -> None:
+    def _keboola_already_triggered(self, job_id: int) -> bool:
+        """
+        Check whether a Keboola trigger was already logged for a job.
+
+        Args:
+            job_id: ID of the job
+
+        Returns:
+            True if a 'keboola_triggered' log entry exists
+        """
+        from app.models import PollingLog  # Import here to avoid circular dependency
+
+        with self._create_db_session() as db:
+            return (
+                db.query(PollingLog.id)
+                .filter(PollingLog.job_id == job_id, PollingLog.status == "keboola_triggered")
+                .first()
+                is not None
+            )
+
+    async def _reschedule_job(self, job: Any, backoff: bool = False) -> None:
         """
         Reschedule a job for the next check.
 
         Args:
             job: Job record
+            backoff: Grow the interval because the check found no changes
         """
         job_id = job.id
 
         try:
             with self._create_db_session() as db:
                 scheduler = JobScheduler(db)
-                next_check = scheduler.schedule_next_check(job_id)
+                next_check = scheduler.schedule_next_check(job_id, backoff=backoff)
                 logger.debug(f"Job {job_id}: Rescheduled for {next_check}")
 
         except Exception as e:
@@ -402,13 +648,46 @@ class PollingService:
 
         # Create new client
         api_token = await self._get_secret_value(secret_id)
-        client = KeboolaClient(storage_api_token=api_token, stack_url=job.keboola_stack_url)
+        client = KeboolaClient(
+            storage_api_token=api_token,
+            stack_url=job.keboola_stack_url,
+            session=self._get_http_session(),
+        )
 
         # Cache for reuse
         self._keboola_clients[secret_id] = client
 
         return client
 
+    def _get_batch_semaphore(self) -> asyncio.Semaphore:
+        """
+        Get or create the semaphore shared by batch checks of all jobs.
+
+        Returns:
+            Semaphore allowing max_concurrent_checks OpenAI checks in flight
+        """
+        if self._batch_semaphore is None:
+            self._batch_semaphore = asyncio.Semaphore(self.max_concurrent_checks)
+
+        return self._batch_semaphore
+
+    def _get_http_session(self) -> aiohttp.ClientSession:
+        """
+        Get or create the HTTP session shared by Keboola clients.
+
+        Returns:
+            Session with a keep-alive connection pool
+        """
+        if self._http_session is None or self._http_session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.HTTP_CONNECTION_LIMIT,
+                limit_per_host=self.HTTP_CONNECTION_LIMIT_PER_HOST,
+                keepalive_timeout=self.HTTP_KEEPALIVE_TIMEOUT,
+            )
+            self._http_session = aiohttp.ClientSession(connector=connector)
+
+        return self._http_session
+
     async def _get_secret_value(self, secret_id: int) -> str:
         """
         Retrieve and decrypt a secret value.
@@ -426,7 +705,7 @@ class PollingService:
         from app.services.encryption import get_encryption_service
 
         with self._create_db_session() as db:
-            secret = db.query(Secret).filter(Secret.id == secret_id).first()
+            secret = db.get(Secret, secret_id)
 
             if not secret:
                 raise ValueError(f"Secret {secret_id} not found")
@@ -574,6 +853,14 @@ class PollingService:
         self._openai_clients.clear()
         self._keboola_clients.clear()
 
+        # Close the shared Keboola HTTP session
+        if self._http_session is not None:
+            try:
+                await self._http_session.close()
+            except Exception as e:
+                logger.warning(f"Error closing HTTP session: {e}")
+            self._http_session = None
+
     @contextmanager
     def _create_db_session(self):
         """
@@ -24,6 +24,9 @@ class JobScheduler:
     - Respecting individual job configurations
     """
 
+    # Idle backoff: cap on how far a job's interval may grow while nothing changes
+    MAX_BACKOFF_MULTIPLIER = 8
+
     def __init__(self, db_session: Session):
         """
         Initialize the job scheduler.
@@ -81,6 +84,7 @@ class JobScheduler:
         self,
         job_id: int,
         poll_interval_seconds: Optional[int] = None,
+        backoff: bool = False,
     ) -> datetime:
         """
         Schedule the next check for a job.
@@ -91,6 +95,10 @@ class JobScheduler:
             job_id: ID of the job to schedule
             poll_interval_seconds: Optional override for poll interval.
                                    If not provided, uses job's configured interval.
+            backoff: Nothing changed since the last check, so count it and double
+                     the interval for each consecutive unchanged check (capped at
+                     MAX_BACKOFF_MULTIPLIER x the poll interval). Without it the
+                     count and the interval reset.
 
         Returns:
             The calculated next check time
@@ -101,7 +109,7 @@ class JobScheduler:
         from app.models import PollingJob  # Import here to avoid circular dependency
 
         try:
-            job = self.db.query(PollingJob).filter(PollingJob.id == job_id).first()
+            job = self.db.get(PollingJob, job_id)
 
             if not job:
                 raise ValueError(f"Job {job_id} not found")
@@ -112,6 +120,12 @@ class JobScheduler:
             if not interval or interval <= 0:
                 raise ValueError(f"Invalid poll interval: {interval}")
 
+            if backoff:
+                job.unchanged_checks += 1
+                interval *= min(2 ** job.unchanged_checks, self.MAX_BACKOFF_MULTIPLIER)
+            else:
+                job.unchanged_checks = 0
+
             # Calculate next check time
             now = datetime.now(timezone.utc)
             next_check = now + timedelta(seconds=interval)
@@ -157,7 +171,7 @@ class JobScheduler:
             raise ValueError(f"Invalid status: {status}. Must be one of {valid_statuses}")
 
         try:
-            job = self.db.query(PollingJob).filter(PollingJob.id == job_id).first()
+            job = self.db.get(PollingJob, job_id)
 
             if not job:
                 raise ValueError(f"Job {job_id} not found")
@@ -247,7 +261,7 @@ class JobScheduler:
         from app.models import PollingJob  # Import here to avoid circular dependency
 
         try:
-            job = self.db.query(PollingJob).filter(PollingJob.id == job_id).first()
+            job = self.db.get(PollingJob, job_id)
 
             if not job:
                 return None
@@ -297,7 +311,7 @@ class JobScheduler:
         from app.models import PollingJob  # Import here to avoid circular dependency
 
         try:
-            job = self.db.query(PollingJob).filter(PollingJob.id == job_id).first()
+            job = self.db.get(PollingJob, job_id)
 
             if not job:
                 raise ValueError(f"Job {job_id} not found")
@@ -83,12 +83,13 @@ class SecretManager:
                 f"Must be one of: {', '.join(self.VALID_SECRET_TYPES)}"
             )
 
-    def create_secret(self, secret_data: SecretCreate) -> SecretResponse:
+    def create_secret(self, secret_data: SecretCreate, commit: bool = True) -> SecretResponse:
         """
         Create a new secret with encryption.
 
         Args:
             secret_data: Secret creation data including name, type, and value
+            commit: If False, only flush and leave the transaction to the caller
 
         Returns:
             SecretResponse with created secret information (without value)
@@ -118,14 +119,18 @@ class SecretManager:
 
             # Add to database
             self.db.add(secret)
-            self.db.commit()
-            self.db.refresh(secret)
+            if commit:
+                self.db.commit()
+                self.db.refresh(secret)
+            else:
+                self.db.flush()
 
             # Return response without the encrypted value
             return SecretResponse.model_validate(secret)
 
         except IntegrityError as e:
-            self.db.rollback()
+            if commit:
+                self.db.rollback()
             if "UNIQUE constraint" in str(e) or "unique" in str(e).lower():
                 raise SecretAlreadyExistsError(
                     f"Secret with name '{secret_data.name}' already exists"
@@ -133,7 +138,8 @@ class SecretManager:
             raise SQLAlchemyError(f"Database error: {str(e)}")
 
         except Exception as e:
-            self.db.rollback()
+            if commit:
+                self.db.rollback()
             raise SQLAlchemyError(f"Failed to create secret: {str(e)}")
 
     def get_secret_by_id(self, secret_id: int, decrypt: bool = False) -> Optional[Secret]:
@@ -147,7 +153,7 @@ class SecretManager:
         Returns:
             Secret model or None if not found
         """
-        secret = self.db.query(Secret).filter(Secret.id == secret_id).first()
+        secret = self.db.get(Secret, secret_id)
 
         if secret and decrypt:
             # Decrypt and trim the value in memory (don't modify the DB object)
@@ -274,7 +280,7 @@ class SecretManager:
             self.db.rollback()
             raise SQLAlchemyError(f"Failed to update secret: {str(e)}")
 
-    def delete_secret(self, secret_id: int, force: bool = False) -> None:
+    def delete_secret(self, secret_id: int, force: bool = False, commit: bool = True) -> None:
         """
         Delete a secret.
 
@@ -284,6 +290,7 @@ class SecretManager:
         Args:
             secret_id: ID of the secret to delete
             force: If True, skip the "in use" check
+            commit: If False, only flush and leave the transaction to the caller
 
         Raises:
             SecretNotFoundError: If secret is not found
@@ -308,10 +315,14 @@ class SecretManager:
 
         try:
             self.db.delete(secret)
-            self.db.commit()
+            if commit:
+                self.db.commit()
+            else:
+                self.db.flush()
 
         except Exception as e:
-            self.db.rollback()
+            if commit:
+                self.db.rollback()
             raise SQLAlchemyError(f"Failed to delete secret: {str(e)}")
 
     def secret_exists(self, name: str) -> bool:
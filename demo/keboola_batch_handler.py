@@ -8,11 +8,105 @@ TeckoChecker sends variableValuesData which Keboola maps to User Parameters.
 Variables are then accessible directly via CommonInterface.configuration.parameters.
 """
 
+import atexit
+import io
 import json
 import logging
-from typing import Any, Dict
+import logging.handlers
+import os
+import sys
+from typing import Any, Dict, List, Optional
 from keboola.component import CommonInterface
 
+try:
+    import orjson
+
+    def json_loads(data: Any) -> Any:
+        return orjson.loads(data)
+
+    def json_dumps_pretty(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+except ImportError:  # orjson is optional; fall back to the stdlib
+
+    def json_loads(data: Any) -> Any:
+        return json.loads(data)
+
+    def json_dumps_pretty(obj: Any) -> str:
+        return json.dumps(obj, indent=2)
+
+
+logger = logging.getLogger(__name__)
+
+CONFIG_PATH = "/data/config.json"
+
+READ_BUFFER_SIZE = 128 * 1024
+
+# Container stdout/stderr are held in memory and written out at exit
+STDIO_BUFFER_SIZE = 8 * 1024 * 1024
+
+# Records buffered per handler before an early flush is forced
+LOG_BUFFER_CAPACITY = 2048
+
+SEPARATOR = "=" * 80
+SUBSEPARATOR = "-" * 80
+SECTION_BREAK = "\n" + SEPARATOR
+
+
+class LazyJSON:
+    """Defer pretty-printing until a handler actually formats the record."""
+
+    def __init__(self, obj: Any):
+        self.obj = obj
+
+    def __str__(self) -> str:
+        return json_dumps_pretty(self.obj)
+
+
+def _parse_array(value: Any) -> list:
+    """Parse an array variable (list or JSON-encoded string)."""
+    # Common case: CommonInterface already decoded the JSON into a list
+    if type(value) is list:
+        return value
+    elif isinstance(value, str):
+        return _decode_array(value)
+    elif isinstance(value, list):
+        return value
+    return []
+
+
+def _decode_array(value: str) -> list:
+    """Decode an array variable that arrived as a JSON string."""
+    if not value:
+        return []
+    try:
+        return json_loads(value)
+    except json.JSONDecodeError:
+        logger.warning(f"Could not parse array variable: {value}")
+        return []
+
+
+def _parse_int(value: Any) -> int:
+    """Parse an int variable (int or numeric string)."""
+    if isinstance(value, int):
+        return value
+    # If it comes as string, convert it
+    if isinstance(value, str):
+        try:
+            return int(value) if value else 0
+        except (ValueError, TypeError):
+            logger.warning(f"Could not parse int variable: {value}")
+            return 0
+    return 0
+
+
+def _parse_str(value: Any) -> str:
+    """Parse a string variable."""
+    return str(value) if value else ""
+
+
+_PARSERS = {"array": _parse_array, "int": _parse_int, "string": _parse_str}
+
 
 def parse_variable(value: Any, var_type: str = "string") -> Any:
     """
@@ -25,167 +119,290 @@ def parse_variable(value: Any, var_type: str = "string") -> Any:
     Returns:
         Parsed value in the correct type
     """
-    if value is None:
-        return [] if var_type == "array" else (0 if var_type == "int" else "")
-
-    if var_type == "array":
-        if isinstance(value, list):
-            return value
-        # If it comes as JSON string, parse it
-        if isinstance(value, str):
-            try:
-                return json.loads(value) if value else []
-            except json.JSONDecodeError:
-                logging.warning(f"Could not parse array variable: {value}")
-                return []
-        return []
+    return _PARSERS.get(var_type, _parse_str)(value)
 
-    elif var_type == "int":
-        if isinstance(value, int):
-            return value
-        # If it comes as string, convert it
-        if isinstance(value, str):
-            try:
-                return int(value) if value else 0
-            except (ValueError, TypeError):
-                logging.warning(f"Could not parse int variable: {value}")
-                return 0
-        return 0
 
-    return str(value) if value else ""
-
-
-def log_batch_metadata(params: Dict[str, Any]) -> None:
+def log_batch_metadata(
+    params: Dict[str, Any],
+    batch_ids_completed: Optional[List[str]] = None,
+    batch_ids_failed: Optional[List[str]] = None,
+) -> None:
     """
     Log batch completion metadata from TeckoChecker.
 
     Args:
         params: Dictionary containing batch metadata (directly in params, not nested)
+        batch_ids_completed: Already parsed completed batch IDs (parsed from params if None)
+        batch_ids_failed: Already parsed failed batch IDs (parsed from params if None)
     """
     # Keboola puts variables directly in params (not in user_properties sub-dict)
     # Parse variables directly from params
-    batch_ids_completed = parse_variable(params.get("batch_ids_completed"), "array")
-    batch_ids_failed = parse_variable(params.get("batch_ids_failed"), "array")
-    batch_count_total = parse_variable(params.get("batch_count_total"), "int")
-    batch_count_completed = parse_variable(params.get("batch_count_completed"), "int")
-    batch_count_failed = parse_variable(params.get("batch_count_failed"), "int")
-
-    logging.info("=" * 80)
-    logging.info("TeckoChecker - Batch Completion")
-    logging.info("=" * 80)
+    if batch_ids_completed is None:
+        batch_ids_completed = _parse_array(params.get("batch_ids_completed"))
+    if batch_ids_failed is None:
+        batch_ids_failed = _parse_array(params.get("batch_ids_failed"))
+    batch_count_total = _parse_int(params.get("batch_count_total"))
+    batch_count_completed = _parse_int(params.get("batch_count_completed"))
+    batch_count_failed = _parse_int(params.get("batch_count_failed"))
+
+    logger.info(SEPARATOR)
+    logger.info("TeckoChecker - Batch Completion")
+    logger.info(SEPARATOR)
 
     # Log raw parameters (as received from Keboola)
-    logging.info("\nRaw parameters:")
-    for key, value in params.items():
-        logging.info(f"  {key}: {value!r}")
+    # repr() of large batch id lists is costly, so only dump them at DEBUG
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "\nRaw parameters:\n%s",
+            "\n".join(f"  {key}: {value!r}" for key, value in params.items()),
+        )
 
     # Log parsed data
-    logging.info("\nParsed data:")
-    logging.info(f"  Total batches: {batch_count_total}")
-    logging.info(f"  Completed: {batch_count_completed}")
-    logging.info(f"  Failed: {batch_count_failed}")
-
-    # Log batch IDs
-    if batch_ids_completed:
-        logging.info(f"\n  Completed batch IDs ({len(batch_ids_completed)}):")
-        for batch_id in batch_ids_completed:
-            logging.info(f"    - {batch_id}")
-
-    if batch_ids_failed:
-        logging.warning(f"\n  Failed batch IDs ({len(batch_ids_failed)}):")
-        for batch_id in batch_ids_failed:
-            logging.warning(f"    - {batch_id}")
+    logger.info("\nParsed data:")
+    logger.info(f"  Total batches: {batch_count_total}")
+    logger.info(f"  Completed: {batch_count_completed}")
+    logger.info(f"  Failed: {batch_count_failed}")
+
+    # Log batch IDs (skip the per-id loops entirely when the level filters them)
+    if batch_ids_completed and logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "\n  Completed batch IDs (%d):\n%s",
+            len(batch_ids_completed),
+            "\n".join(f"    - {batch_id}" for batch_id in batch_ids_completed),
+        )
+
+    if batch_ids_failed and logger.isEnabledFor(logging.WARNING):
+        logger.warning(
+            "\n  Failed batch IDs (%d):\n%s",
+            len(batch_ids_failed),
+            "\n".join(f"    - {batch_id}" for batch_id in batch_ids_failed),
+        )
 
     # Overall status
-    logging.info("")
+    logger.info("")
     if batch_count_failed == 0:
-        logging.info("✓ All batches completed successfully!")
+        logger.info("✓ All batches completed successfully!")
     elif batch_count_completed > 0:
-        logging.warning(f"⚠ Partial success: {batch_count_completed}/{batch_count_total} completed")
+        logger.warning(f"⚠ Partial success: {batch_count_completed}/{batch_count_total} completed")
     else:
-        logging.error(f"✗ All batches failed ({batch_count_failed}/{batch_count_total})")
+        logger.error(f"✗ All batches failed ({batch_count_failed}/{batch_count_total})")
 
-    logging.info("=" * 80)
+    logger.info(SEPARATOR)
 
 
-def main():
-    """Main entry point."""
-    import os
+class StreamBatchHandler(logging.handlers.MemoryHandler):
+    """MemoryHandler that flushes into a stream target with a single write()."""
 
-    logging.info("=" * 80)
-    logging.info("🚀 TeckoChecker - Batch Completion Handler")
-    logging.info("=" * 80)
+    def flush(self) -> None:
+        target = self.target
+        if not isinstance(target, logging.StreamHandler) or target.stream is None:
+            super().flush()
+            return
 
-    # STEP 1: Read /data/config.json directly from disk
-    logging.info("\n" + "=" * 80)
-    logging.info("STEP 1: Reading /data/config.json from disk")
-    logging.info("=" * 80)
+        with self.lock:
+            if not self.buffer:
+                return
+            try:
+                text = "".join(
+                    target.format(record) + target.terminator
+                    for record in self.buffer
+                    if record.levelno >= target.level and target.filter(record)
+                )
+                with target.lock:
+                    target.stream.write(text)
+                    target.stream.flush()
+            except Exception:
+                target.handleError(self.buffer[-1])
+            finally:
+                self.buffer.clear()
+
+
+def buffer_log_handlers() -> List[logging.handlers.MemoryHandler]:
+    """
+    Wrap root log handlers in MemoryHandlers so per-batch-id records are
+    written in one burst instead of one write per record.
 
-    config_path = "/data/config.json"
-    config_data = None
+    Returns:
+        List of installed MemoryHandlers (flush them before exiting)
+    """
+    root = logging.getLogger()
+    buffers = []
+    for handler in list(root.handlers):
+        if isinstance(handler, logging.handlers.MemoryHandler):
+            continue
+        memory_handler = StreamBatchHandler(
+            capacity=LOG_BUFFER_CAPACITY,
+            flushLevel=logging.CRITICAL + 1,
+            target=handler,
+        )
+        root.removeHandler(handler)
+        root.addHandler(memory_handler)
+        buffers.append(memory_handler)
+    return buffers
+
+
+def log_step(title: str) -> None:
+    """Log a banner that separates the script's processing steps."""
+    logger.info(SECTION_BREAK)
+    logger.info(title)
+    logger.info(SEPARATOR)
+
+
+def process_parameters(params: Dict[str, Any]) -> None:
+    """
+    Log received parameters and batch metadata.
 
+    Args:
+        params: Parameters from CommonInterface.configuration.parameters
+    """
+    logger.info("\n📦 CommonInterface.configuration.parameters:")
+    logger.info("%s", LazyJSON(params))
+
+    if not params:
+        logger.error("\n❌ No parameters from CommonInterface!")
+        return
+
+    # Keboola variables are mapped directly to params (not nested in user_properties)
+    logger.info("\n✓ Parameters received from Keboola variables")
+
+    # STEP 3: Parse and log batch metadata
+    log_step("STEP 3: Parsing batch metadata")
+    batch_ids_completed = _parse_array(params.get("batch_ids_completed"))
+    batch_ids_failed = _parse_array(params.get("batch_ids_failed"))
+    log_batch_metadata(params, batch_ids_completed, batch_ids_failed)
+
+    # Add your custom processing logic here, reusing the parsed batch ID lists
+    # Example: Download batch results, send notifications, etc.
+
+    logger.info("\n✓ Script completed successfully")
+
+
+def read_file_bytes(path: str) -> bytes:
+    """
+    Read a whole file in one go without updating its access time.
+
+    Args:
+        path: File to read
+
+    Returns:
+        File content as bytes (json_loads accepts bytes directly)
+    """
+    flags = os.O_RDONLY | getattr(os, "O_NOATIME", 0)
+    try:
+        fd = os.open(path, flags)
+    except PermissionError:
+        # O_NOATIME is only allowed for the file owner; retry without it
+        fd = os.open(path, os.O_RDONLY)
+    with os.fdopen(fd, "rb", buffering=READ_BUFFER_SIZE) as f:
+        return f.read()
+
+
+def dump_config_file(config_path: str = CONFIG_PATH) -> None:
+    """
+    Read config.json straight from disk and log its raw content.
+
+    CommonInterface parses the same file, so this is a debugging aid only
+    (enable with TECKO_DEBUG_CONFIG=1).
+
+    Args:
+        config_path: Path to the Keboola configuration file
+    """
     if os.path.exists(config_path):
-        logging.info(f"✓ File exists at: {config_path}")
+        logger.info(f"✓ File exists at: {config_path}")
         try:
-            with open(config_path, 'r') as f:
-                config_data = json.load(f)
+            config_data = json_loads(read_file_bytes(config_path))
 
-            logging.info("\n📄 RAW /data/config.json content:")
-            logging.info("-" * 80)
-            logging.info(json.dumps(config_data, indent=2))
-            logging.info("-" * 80)
+            logger.info("\n📄 RAW /data/config.json content:")
+            logger.info(SUBSEPARATOR)
+            logger.info("%s", LazyJSON(config_data))
+            logger.info(SUBSEPARATOR)
 
             # Show parameters specifically
             if "parameters" in config_data:
-                logging.info("\n✓ Found 'parameters' in config.json:")
-                logging.info(json.dumps(config_data["parameters"], indent=2))
+                logger.info("\n✓ Found 'parameters' in config.json:")
+                logger.info("%s", LazyJSON(config_data["parameters"]))
 
                 if "user_properties" in config_data.get("parameters", {}):
-                    logging.info("\n✓ Found 'user_properties' in parameters:")
-                    logging.info(json.dumps(config_data["parameters"]["user_properties"], indent=2))
+                    logger.info("\n✓ Found 'user_properties' in parameters:")
+                    logger.info("%s", LazyJSON(config_data["parameters"]["user_properties"]))
                 else:
-                    logging.warning("\n⚠️ No 'user_properties' in parameters")
+                    logger.warning("\n⚠️ No 'user_properties' in parameters")
             else:
-                logging.warning("\n⚠️ No 'parameters' key in config.json")
+                logger.warning("\n⚠️ No 'parameters' key in config.json")
 
         except Exception as e:
-            logging.error(f"❌ Failed to read config.json: {e}")
+            logger.error(f"❌ Failed to read config.json: {e}")
     else:
-        logging.error(f"❌ Config file NOT found at: {config_path}")
+        logger.error(f"❌ Config file NOT found at: {config_path}")
 
-    # STEP 2: Initialize CommonInterface and read parameters
-    logging.info("\n" + "=" * 80)
-    logging.info("STEP 2: Reading via CommonInterface")
-    logging.info("=" * 80)
 
-    ci = CommonInterface()
-    params = ci.configuration.parameters
+def buffer_stdio() -> None:
+    """
+    Replace sys.stdout/sys.stderr with large in-memory buffered writers so the
+    container log pipe receives a few big writes instead of one per record.
 
-    logging.info("\n📦 CommonInterface.configuration.parameters:")
-    logging.info(json.dumps(params, indent=2))
+    Must run before CommonInterface() so its log handlers bind to the
+    buffered streams. The underlying descriptors are duplicated, so closing
+    the buffered streams never closes the real stdout/stderr.
+    """
+    for name in ("stdout", "stderr"):
+        stream = getattr(sys, name)
+        raw = io.FileIO(os.dup(stream.fileno()), "w")
+        setattr(
+            sys,
+            name,
+            io.TextIOWrapper(
+                io.BufferedWriter(raw, buffer_size=STDIO_BUFFER_SIZE),
+                encoding=stream.encoding,
+                errors=stream.errors,
+            ),
+        )
+    atexit.register(flush_stdio)
+
+
+def flush_stdio() -> None:
+    """Write out anything still held in the stdout/stderr buffers."""
+    for stream in (sys.stdout, sys.stderr):
+        try:
+            stream.flush()
+        except (OSError, ValueError):
+            pass
 
-    if not params:
-        logging.error("\n❌ No parameters from CommonInterface!")
-        return
 
-    # Keboola variables are mapped directly to params (not nested in user_properties)
-    logging.info("\n✓ Parameters received from Keboola variables")
+def main():
+    """Main entry point."""
+    buffer_stdio()
 
-    # STEP 3: Parse and log batch metadata
-    logging.info("\n" + "=" * 80)
-    logging.info("STEP 3: Parsing batch metadata")
-    logging.info("=" * 80)
-    log_batch_metadata(params)
+    logger.info(SEPARATOR)
+    logger.info("🚀 TeckoChecker - Batch Completion Handler")
+    logger.info(SEPARATOR)
 
-    # Add your custom processing logic here
-    # Example: Download batch results, send notifications, etc.
+    # STEP 1 (debug only): Read /data/config.json directly from disk
+    if os.getenv("TECKO_DEBUG_CONFIG"):
+        log_step("STEP 1: Reading /data/config.json from disk")
+        dump_config_file()
 
-    logging.info("\n✓ Script completed successfully")
+    # STEP 2: Initialize CommonInterface and read parameters
+    log_step("STEP 2: Reading via CommonInterface")
+
+    ci = CommonInterface()
+    params = ci.configuration.parameters
+
+    # CommonInterface installs the log handlers; buffer them from here on
+    log_buffers = buffer_log_handlers()
+    try:
+        process_parameters(params)
+    finally:
+        for memory_handler in log_buffers:
+            memory_handler.flush()
 
 
 if __name__ == "__main__":
     try:
         main()
     except Exception as e:
-        logging.error(f"❌ ERROR: {type(e).__name__}: {str(e)}")
+        logger.error(f"❌ ERROR: {type(e).__name__}: {str(e)}")
+        # Make sure buffered logs reach the container before the traceback
+        logging.shutdown()
+        flush_stdio()
         raise
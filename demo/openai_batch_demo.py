@@ -7,18 +7,83 @@ It creates a simple batch job with a few test requests and monitors its progress
 """
 
 import argparse
+import importlib.util
 import json
 import os
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional
 from datetime import datetime
 
-import requests
+import httpx
 from dotenv import load_dotenv
 import tempfile
 
+try:
+    import orjson
+
+    json_dumps_bytes = orjson.dumps
+    json_loads = orjson.loads
+except ImportError:  # orjson is optional; fall back to the stdlib
+
+    def json_dumps_bytes(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+    json_loads = json.loads
+
+# HTTP/2 needs the optional 'h2' package (pip install httpx[http2])
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+# Status polling backoff for monitor_batch
+BACKOFF_FACTOR = 1.5
+MAX_CHECK_INTERVAL = 60
+
+# Upper bound on parallel status requests in get_batch_statuses
+MAX_CONCURRENT_CHECKS = 10
+
+# Sample questions for the batch
+QUESTIONS = (
+    "What is the capital of France?",
+    "Explain photosynthesis in simple terms.",
+    "What are the primary colors?",
+    "How does a computer work?",
+    "What is machine learning?",
+)
+
+SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are a helpful assistant. Keep your responses brief."
+}
+
+# Batch request line serialized once; the placeholders mark where the
+# per-request custom_id and user question are spliced in
+REQUEST_TEMPLATE = json.dumps({
+    "custom_id": "__CUSTOM_ID__",
+    "method": "POST",
+    "url": "/v1/chat/completions",
+    "body": {
+        "model": "gpt-3.5-turbo",
+        "messages": [
+            SYSTEM_MESSAGE,
+            {
+                "role": "user",
+                "content": "__CONTENT__"
+            }
+        ],
+        "max_tokens": 100,
+        "temperature": 0.7
+    }
+})
+REQUEST_LINE_HEAD, _rest = REQUEST_TEMPLATE.encode().split(b'"__CUSTOM_ID__"')
+REQUEST_LINE_MIDDLE, REQUEST_LINE_TAIL = _rest.split(b'"__CONTENT__"')
+REQUEST_LINE_TAIL += b"\n"
+del _rest
+
 # Load environment variables from .env file
 env_path = Path(__file__).parent / '.env'
 if env_path.exists():
@@ -41,6 +106,21 @@ class OpenAIBatchDemo:
         self.headers = {
             "Authorization": f"Bearer {self.api_key}",
         }
+        # Last ETag and body per batch, for conditional status requests
+        self._batch_etags: Dict[str, str] = {}
+        self._batch_cache: Dict[str, Dict] = {}
+        # One pooled client so every call reuses the same TLS connection
+        self.client = httpx.Client(
+            base_url=self.base_url,
+            headers=self.headers,
+            http2=HTTP2_AVAILABLE,
+            timeout=60.0,
+            limits=httpx.Limits(max_keepalive_connections=4),
+        )
+
+    def close(self):
+        """Close the underlying HTTP connection pool."""
+        self.client.close()
 
     def create_batch_input_file(self, num_requests: int = 3) -> str:
         """
@@ -54,46 +134,22 @@ class OpenAIBatchDemo:
         """
         print(f"📝 Creating batch input file with {num_requests} requests...")
 
-        # Create sample requests
-        requests_data = []
-
-        # Sample questions for the batch
-        questions = [
-            "What is the capital of France?",
-            "Explain photosynthesis in simple terms.",
-            "What are the primary colors?",
-            "How does a computer work?",
-            "What is machine learning?",
-        ]
-
-        for i in range(min(num_requests, len(questions))):
-            request = {
-                "custom_id": f"request-{i+1}",
-                "method": "POST",
-                "url": "/v1/chat/completions",
-                "body": {
-                    "model": "gpt-3.5-turbo",
-                    "messages": [
-                        {
-                            "role": "system",
-                            "content": "You are a helpful assistant. Keep your responses brief."
-                        },
-                        {
-                            "role": "user",
-                            "content": questions[i]
-                        }
-                    ],
-                    "max_tokens": 100,
-                    "temperature": 0.7
-                }
-            }
-            requests_data.append(request)
-
-        # Write to JSONL file
-        temp_file = tempfile.NamedTemporaryFile(mode='w', suffix='.jsonl', delete=False)
-        for request in requests_data:
-            temp_file.write(json.dumps(request) + '\n')
-        temp_file.close()
+        # Only custom_id and the question differ per request; splice them into
+        # the pre-serialized template instead of dumping a full dict each time
+        def request_line_parts():
+            for i in range(min(num_requests, len(QUESTIONS))):
+                yield REQUEST_LINE_HEAD
+                yield json_dumps_bytes(f"request-{i+1}")
+                yield REQUEST_LINE_MIDDLE
+                yield json_dumps_bytes(QUESTIONS[i])
+                yield REQUEST_LINE_TAIL
+
+        # Write to JSONL file; pieces go straight into the file buffer
+        # without being concatenated into per-line strings first
+        with tempfile.NamedTemporaryFile(
+            mode='wb', suffix='.jsonl', delete=False, buffering=WRITE_BUFFER_SIZE
+        ) as temp_file:
+            temp_file.writelines(request_line_parts())
 
         print(f"✅ Created batch input file: {temp_file.name}")
         return temp_file.name
@@ -110,8 +166,6 @@ class OpenAIBatchDemo:
         """
         print(f"📤 Uploading file to OpenAI...")
 
-        url = f"{self.base_url}/files"
-
         with open(file_path, 'rb') as f:
             files = {
                 'file': (os.path.basename(file_path), f, 'application/jsonl')
@@ -120,7 +174,9 @@ class OpenAIBatchDemo:
                 'purpose': 'batch'
             }
 
-            response = requests.post(url, headers=self.headers, files=files, data=data)
+            # httpx streams file fields in chunks, so the JSONL is never
+            # loaded into memory as a whole
+            response = self.client.post("/files", files=files, data=data)
 
         if response.status_code != 200:
             raise Exception(f"File upload failed: {response.status_code} - {response.text}")
@@ -146,19 +202,13 @@ class OpenAIBatchDemo:
         """
         print(f"🚀 Creating batch job...")
 
-        url = f"{self.base_url}/batches"
-
         payload = {
             "input_file_id": file_id,
             "endpoint": "/v1/chat/completions",
             "completion_window": "24h"
         }
 
-        response = requests.post(
-            url,
-            headers={**self.headers, "Content-Type": "application/json"},
-            json=payload
-        )
+        response = self.client.post("/batches", json=payload)
 
         if response.status_code != 200:
             raise Exception(f"Batch creation failed: {response.status_code} - {response.text}")
@@ -181,43 +231,90 @@ class OpenAIBatchDemo:
             batch_id: ID of the batch job
 
         Returns:
-            Batch status data
+            Batch status data (the cached object itself if the server
+            answers 304 Not Modified)
         """
-        url = f"{self.base_url}/batches/{batch_id}"
+        headers = {}
+        etag = self._batch_etags.get(batch_id)
+        if etag:
+            headers["If-None-Match"] = etag
+
+        response = self.client.get(f"/batches/{batch_id}", headers=headers)
 
-        response = requests.get(url, headers=self.headers)
+        if response.status_code == 304 and batch_id in self._batch_cache:
+            return self._batch_cache[batch_id]
 
         if response.status_code != 200:
             raise Exception(f"Failed to get batch status: {response.status_code} - {response.text}")
 
-        return response.json()
+        batch_data = response.json()
+        if "etag" in response.headers:
+            self._batch_etags[batch_id] = response.headers["etag"]
+            self._batch_cache[batch_id] = batch_data
+        return batch_data
+
+    def get_batch_statuses(self, batch_ids: List[str]) -> List[Dict]:
+        """
+        Get the status of several batch jobs concurrently.
+
+        The requests share the client's connection pool (multiplexed over a
+        single connection when HTTP/2 is available).
+
+        Args:
+            batch_ids: IDs of the batch jobs
+
+        Returns:
+            Batch status data, in the same order as batch_ids
+        """
+        if len(batch_ids) <= 1:
+            return [self.get_batch_status(batch_id) for batch_id in batch_ids]
+
+        with ThreadPoolExecutor(max_workers=min(len(batch_ids), MAX_CONCURRENT_CHECKS)) as pool:
+            return list(pool.map(self.get_batch_status, batch_ids))
 
     def monitor_batch(self, batch_id: str, check_interval: int = 5) -> Dict:
         """
         Monitor a batch job until completion.
 
+        The wait between checks grows exponentially up to MAX_CHECK_INTERVAL
+        and resets to check_interval whenever request counts advance.
+
         Args:
             batch_id: ID of the batch job to monitor
-            check_interval: Seconds between status checks
+            check_interval: Initial seconds between status checks
 
         Returns:
             Final batch status data
         """
-        print(f"\n📊 Monitoring batch job (checking every {check_interval} seconds)...")
+        print(f"\n📊 Monitoring batch job (checking every {check_interval}-"
+              f"{MAX_CHECK_INTERVAL} seconds)...")
         print("-" * 60)
 
+        interval = check_interval
+        last_progress = None
+        last_batch_data = None
+
         while True:
             batch_data = self.get_batch_status(batch_id)
+            if batch_data is last_batch_data:
+                # 304 Not Modified: nothing new to parse or print
+                time.sleep(interval)
+                interval = min(interval * BACKOFF_FACTOR, MAX_CHECK_INTERVAL)
+                continue
+            last_batch_data = batch_data
             status = batch_data['status']
 
             # Display progress
             timestamp = datetime.now().strftime("%H:%M:%S")
             counts = batch_data.get('request_counts', {})
 
-            print(f"[{timestamp}] Status: {status.upper()}")
-            print(f"   Total: {counts.get('total', 0)} | "
-                  f"Completed: {counts.get('completed', 0)} | "
-                  f"Failed: {counts.get('failed', 0)}")
+            sys.stdout.write(
+                f"[{timestamp}] Status: {status.upper()}\n"
+                f"   Total: {counts.get('total', 0)} | "
+                f"Completed: {counts.get('completed', 0)} | "
+                f"Failed: {counts.get('failed', 0)}\n"
+            )
+            sys.stdout.flush()
 
             # Check if job is complete
             if status in ['completed', 'failed', 'expired', 'cancelled']:
@@ -231,7 +328,13 @@ class OpenAIBatchDemo:
 
                 return batch_data
 
-            time.sleep(check_interval)
+            # Back off while nothing changes; poll closely again on progress
+            progress = (counts.get('completed', 0), counts.get('failed', 0))
+            if progress != last_progress:
+                interval = check_interval
+                last_progress = progress
+            time.sleep(interval)
+            interval = min(interval * BACKOFF_FACTOR, MAX_CHECK_INTERVAL)
 
     def download_results(self, file_id: str, output_path: Optional[str] = None) -> str:
         """
@@ -246,28 +349,32 @@ class OpenAIBatchDemo:
         """
         print(f"\n📥 Downloading results...")
 
-        url = f"{self.base_url}/files/{file_id}/content"
-        response = requests.get(url, headers=self.headers)
-
-        if response.status_code != 200:
-            raise Exception(f"Failed to download file: {response.status_code} - {response.text}")
-
-        # Save to file
+        # Save to file, streaming the body instead of buffering it in memory
         if not output_path:
             output_path = f"batch_output_{file_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl"
 
-        with open(output_path, 'wb') as f:
-            f.write(response.content)
+        with self.client.stream("GET", f"/files/{file_id}/content") as response:
+            if response.status_code != 200:
+                response.read()
+                raise Exception(
+                    f"Failed to download file: {response.status_code} - {response.text}"
+                )
+
+            with open(output_path, 'wb') as f:
+                for chunk in response.iter_bytes(DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
 
         print(f"✅ Results saved to: {output_path}")
 
         # Display sample results
         print("\n📋 Sample results:")
         print("-" * 60)
-        with open(output_path, 'r') as f:
-            lines = f.readlines()
-            for i, line in enumerate(lines[:2], 1):  # Show first 2 results
-                result = json.loads(line)
+        line_count = 0
+        with open(output_path, 'rb') as f:
+            for line_count, line in enumerate(f, 1):
+                if line_count > 2:  # Show first 2 results, just count the rest
+                    continue
+                result = json_loads(line)
                 custom_id = result.get('custom_id', 'N/A')
 
                 if 'response' in result and 'body' in result['response']:
@@ -278,8 +385,8 @@ class OpenAIBatchDemo:
                 else:
                     print(f"{custom_id}: [No response]")
 
-        if len(lines) > 2:
-            print(f"... and {len(lines) - 2} more results")
+        if line_count > 2:
+            print(f"... and {line_count - 2} more results")
 
         return output_path
 
@@ -337,6 +444,7 @@ Examples:
   %(prog)s -n 5               # Run demo with 5 test requests
   %(prog)s --no-monitor       # Create batch without monitoring
   %(prog)s --check-batch ID   # Check status of existing batch
+  %(prog)s --check-batch ID1 ID2  # Check several batches concurrently
   %(prog)s --download FILE_ID # Download batch results
 
 Environment:
@@ -361,7 +469,8 @@ Environment:
     parser.add_argument(
         '--check-batch',
         metavar='BATCH_ID',
-        help='Check the status of an existing batch job'
+        nargs='+',
+        help='Check the status of one or more existing batch jobs'
     )
 
     parser.add_argument(
@@ -384,35 +493,38 @@ Environment:
         print(f"❌ {e}")
         sys.exit(1)
 
-    # Handle different modes
-    if args.check_batch:
-        # Check batch status
-        try:
-            batch_data = demo.get_batch_status(args.check_batch)
-            print(f"Batch ID: {batch_data['id']}")
-            print(f"Status: {batch_data['status']}")
-            print(f"Request counts: {batch_data.get('request_counts', {})}")
-            if batch_data.get('output_file_id'):
-                print(f"Output file: {batch_data['output_file_id']}")
-        except Exception as e:
-            print(f"❌ Error: {e}")
-            sys.exit(1)
-
-    elif args.download:
-        # Download results
-        try:
-            demo.download_results(args.download)
-        except Exception as e:
-            print(f"❌ Error: {e}")
-            sys.exit(1)
-
-    else:
-        # Run full demo
-        num_requests = min(max(1, args.num_requests), 5)
-        demo.run_demo(
-            num_requests=num_requests,
-            monitor=not args.no_monitor
-        )
+    try:
+        # Handle different modes
+        if args.check_batch:
+            # Check batch status (several IDs are fetched concurrently)
+            try:
+                for batch_data in demo.get_batch_statuses(args.check_batch):
+                    print(f"Batch ID: {batch_data['id']}")
+                    print(f"Status: {batch_data['status']}")
+                    print(f"Request counts: {batch_data.get('request_counts', {})}")
+                    if batch_data.get('output_file_id'):
+                        print(f"Output file: {batch_data['output_file_id']}")
+            except Exception as e:
+                print(f"❌ Error: {e}")
+                sys.exit(1)
+
+        elif args.download:
+            # Download results
+            try:
+                demo.download_results(args.download)
+            except Exception as e:
+                print(f"❌ Error: {e}")
+                sys.exit(1)
+
+        else:
+            # Run full demo
+            num_requests = min(max(1, args.num_requests), 5)
+            demo.run_demo(
+                num_requests=num_requests,
+                monitor=not args.no_monitor
+            )
+    finally:
+        demo.close()
 
 
 if __name__ == '__main__':
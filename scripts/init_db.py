@@ -9,9 +9,10 @@ from pathlib import Path
 # Add parent directory to path to allow imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from sqlalchemy import text
+
 from app.database import init_db, drop_db, get_db_manager
-from app.config import get_settings
-from cryptography.fernet import Fernet
+from app.config import Settings, get_settings
 
 
 def print_banner():
@@ -22,9 +23,8 @@ def print_banner():
     print()
 
 
-def check_secret_key():
+def check_secret_key(settings: Settings):
     """Check if SECRET_KEY is properly configured."""
-    settings = get_settings()
     if (
         not settings.secret_key
         or settings.secret_key == "your-secret-key-for-encryption-change-this-in-production"
@@ -55,35 +55,40 @@ def initialize_database(reset: bool = False):
     print()
 
     # Check secret key configuration
-    check_secret_key()
+    check_secret_key(settings)
 
     db_manager = get_db_manager()
 
-    # Check connection
+    # Check connection; the same connection is reused for all DDL below
     print("Checking database connection...")
-    if not db_manager.check_connection():
+    try:
+        conn = db_manager.engine.connect()
+        conn.execute(text("SELECT 1"))
+    except Exception:
         print("ERROR: Cannot connect to database!")
         sys.exit(1)
     print("✓ Database connection successful")
     print()
 
-    if reset:
-        print("WARNING: This will delete all existing data!")
-        response = input("Are you sure you want to reset the database? (yes/NO): ")
-        if response.lower() != "yes":
-            print("Aborted.")
-            sys.exit(1)
-
-        print("Dropping existing tables...")
-        drop_db()
-        print("✓ Tables dropped")
+    with conn:
+        if reset:
+            print("WARNING: This will delete all existing data!")
+            response = input("Are you sure you want to reset the database? (yes/NO): ")
+            if response.lower() != "yes":
+                print("Aborted.")
+                sys.exit(1)
+
+            print("Dropping existing tables...")
+            drop_db(bind=conn)
+            print("✓ Tables dropped")
+            print()
+
+        print("Creating database tables...")
+        init_db(bind=conn)
+        conn.commit()
+        print("✓ Tables created successfully")
         print()
 
-    print("Creating database tables...")
-    init_db()
-    print("✓ Tables created successfully")
-    print()
-
     # Display created tables
     tables = db_manager.get_table_names()
     print(f"Created {len(tables)} tables:")
@@ -114,7 +119,9 @@ def create_env_file_if_needed():
         with open(env_example_path, "r") as f:
             content = f.read()
 
-        # Generate a new secret key
+        # Generate a new secret key (cryptography is only needed on this path)
+        from cryptography.fernet import Fernet
+
         secret_key = Fernet.generate_key().decode()
         content = content.replace(
             "your-secret-key-for-encryption-change-this-in-production", secret_key
@@ -22,6 +22,115 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from app.config import get_settings
 
+# Rows fetched and inserted per executemany round when migrating data
+MIGRATION_CHUNK_SIZE = 1000
+
+
+def _sqlite_version(session) -> tuple:
+    """Return the SQLite library version as a tuple of ints."""
+    version = session.execute(text("SELECT sqlite_version()")).scalar()
+    return tuple(int(part) for part in version.split("."))
+
+
+def _can_drop_batch_id_in_place(session, columns: dict, foreign_keys: list) -> bool:
+    """
+    Check whether polling_jobs can lose batch_id via ALTER TABLE DROP COLUMN.
+
+    Requires SQLite 3.35+, batch_id not being part of a UNIQUE/PK constraint,
+    and the remaining columns already matching the v1.0 table (nullable
+    secret references with ON DELETE SET NULL); otherwise the full table
+    rewrite is used so the resulting schema is identical either way.
+
+    Args:
+        session: Migration session
+        columns: polling_jobs columns by name, from the Step 1 schema snapshot
+        foreign_keys: polling_jobs foreign keys, from the Step 1 schema snapshot
+    """
+    if _sqlite_version(session) < (3, 35, 0):
+        return False
+
+    # Only plain CREATE INDEX indexes can be dropped beforehand
+    if any(origin != "c" for _, origin in _batch_id_indexes(session)):
+        return False
+
+    for column_name in ("openai_secret_id", "keboola_secret_id"):
+        column = columns.get(column_name)
+        fk = next(
+            (fk for fk in foreign_keys if fk["constrained_columns"] == [column_name]), None
+        )
+        if column is None or not column["nullable"] or fk is None:
+            return False
+        if fk.get("options", {}).get("ondelete", "").upper() != "SET NULL":
+            return False
+    return True
+
+
+def _batch_id_indexes(session) -> list:
+    """Return (name, origin) for every polling_jobs index covering batch_id."""
+    found = []
+    indexes = session.execute(text("PRAGMA index_list(polling_jobs)")).mappings().all()
+    for index in indexes:
+        columns = session.execute(text(f"PRAGMA index_info('{index['name']}')")).mappings()
+        if any(column["name"] == "batch_id" for column in columns):
+            found.append((index["name"], index["origin"]))
+    return found
+
+
+def _drop_batch_id_indexes(session) -> None:
+    """Drop explicit indexes on polling_jobs.batch_id (DROP COLUMN refuses indexed columns)."""
+    for name, _ in _batch_id_indexes(session):
+        session.execute(text(f'DROP INDEX "{name}"'))
+
+
+def _recreate_polling_jobs(session) -> None:
+    """Rebuild polling_jobs without batch_id (for SQLite < 3.35 or legacy constraints)."""
+    result = session.execute(text("""
+        SELECT id, name, openai_secret_id, keboola_secret_id,
+               keboola_stack_url, keboola_component_id, keboola_configuration_id,
+               poll_interval_seconds, status, last_check_at, next_check_at,
+               created_at, completed_at
+        FROM polling_jobs
+    """))
+    jobs_data = result.fetchall()
+
+    # Drop and recreate
+    session.execute(text("DROP TABLE polling_jobs"))
+    session.execute(text("""
+        CREATE TABLE polling_jobs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name VARCHAR(255) NOT NULL,
+            openai_secret_id INTEGER,
+            keboola_secret_id INTEGER,
+            keboola_stack_url VARCHAR(500) NOT NULL,
+            keboola_component_id VARCHAR(255) NOT NULL,
+            keboola_configuration_id VARCHAR(255) NOT NULL,
+            poll_interval_seconds INTEGER NOT NULL DEFAULT 120,
+            status VARCHAR(50) NOT NULL DEFAULT 'active',
+            unchanged_checks INTEGER NOT NULL DEFAULT 0,
+            last_check_at DATETIME,
+            next_check_at DATETIME,
+            created_at DATETIME NOT NULL,
+            completed_at DATETIME,
+            FOREIGN KEY (openai_secret_id) REFERENCES secrets(id) ON DELETE SET NULL,
+            FOREIGN KEY (keboola_secret_id) REFERENCES secrets(id) ON DELETE SET NULL
+        )
+    """))
+
+    # Restore data
+    if jobs_data:
+        session.execute(text("""
+            INSERT INTO polling_jobs
+            (id, name, openai_secret_id, keboola_secret_id,
+             keboola_stack_url, keboola_component_id, keboola_configuration_id,
+             poll_interval_seconds, status, last_check_at, next_check_at,
+             created_at, completed_at)
+            VALUES
+            (:id, :name, :openai_secret_id, :keboola_secret_id,
+             :keboola_stack_url, :keboola_component_id, :keboola_configuration_id,
+             :poll_interval_seconds, :status, :last_check_at, :next_check_at,
+             :created_at, :completed_at)
+        """), [dict(row._mapping) for row in jobs_data])
+
 
 def migrate(dry_run: bool = False) -> bool:
     """
@@ -30,7 +139,8 @@ def migrate(dry_run: bool = False) -> bool:
     Steps:
     1. Create new job_batches table
     2. Migrate existing polling_jobs.batch_id → JobBatch records
-    3. Recreate polling_jobs table without batch_id column (SQLite limitation)
+    3. Drop polling_jobs.batch_id (ALTER TABLE on SQLite 3.35+, table rewrite otherwise)
+       and add polling_jobs.unchanged_checks
     4. Create indexes
 
     Args:
@@ -42,7 +152,8 @@ def migrate(dry_run: bool = False) -> bool:
     settings = get_settings()
     db_url = settings.database_url
 
-    engine = create_engine(db_url, connect_args={"check_same_thread": False} if "sqlite" in db_url else {})
+    is_sqlite = "sqlite" in db_url
+    engine = create_engine(db_url, connect_args={"check_same_thread": False} if is_sqlite else {})
     Session = sessionmaker(bind=engine)
     session = Session()
 
@@ -53,10 +164,14 @@ def migrate(dry_run: bool = False) -> bool:
     print(f"Mode: {'DRY RUN' if dry_run else 'LIVE MIGRATION'}")
     print()
 
+    # Original SQLite journal mode, restored in the finally block
+    journal_mode = None
+
     try:
         # Step 1: Check current schema
-        inspector = inspect(engine)
-        tables = inspector.get_table_names()
+        # Snapshot the schema once, on the session's own connection
+        inspector = inspect(session.connection())
+        tables = set(inspector.get_table_names())
 
         print("Step 1: Checking existing schema...")
         if "polling_jobs" not in tables:
@@ -71,27 +186,38 @@ def migrate(dry_run: bool = False) -> bool:
                 return False
 
         # Check if batch_id column exists
-        columns = [col['name'] for col in inspector.get_columns('polling_jobs')]
-        if 'batch_id' not in columns:
+        polling_job_columns = {col['name']: col for col in inspector.get_columns('polling_jobs')}
+        polling_job_foreign_keys = inspector.get_foreign_keys('polling_jobs')
+        if 'batch_id' not in polling_job_columns:
             print("⚠️  WARNING: batch_id column not found in polling_jobs. Schema may already be migrated.")
-            print("Existing columns:", columns)
+            print("Existing columns:", list(polling_job_columns))
             return False
 
         # Step 2: Read existing jobs
         print("\nStep 2: Reading existing polling jobs...")
-        result = session.execute(text("SELECT id, batch_id FROM polling_jobs"))
-        existing_jobs = [(row[0], row[1]) for row in result.fetchall()]
-        print(f"Found {len(existing_jobs)} existing jobs")
+        job_count = session.execute(text("SELECT COUNT(*) FROM polling_jobs")).scalar()
+        print(f"Found {job_count} existing jobs")
 
         if dry_run:
             print("\n[DRY RUN] Would migrate the following jobs:")
-            for job_id, batch_id in existing_jobs[:5]:  # Show first 5
+            preview = session.execute(text("SELECT id, batch_id FROM polling_jobs LIMIT 5"))
+            for job_id, batch_id in preview:  # Show first 5
                 print(f"  - Job {job_id}: batch_id='{batch_id}' → JobBatch record")
-            if len(existing_jobs) > 5:
-                print(f"  ... and {len(existing_jobs) - 5} more")
+            if job_count > 5:
+                print(f"  ... and {job_count - 5} more")
             print("\n[DRY RUN] No changes made to database.")
             return True
 
+        # Steps 3-6 run as one transaction: a single commit (and fsync) at the
+        # end, and a failure leaves the database untouched
+        if is_sqlite:
+            # Skip fsyncs for the bulk rewrite; the journal mode is restored after
+            journal_mode = session.execute(text("PRAGMA journal_mode")).scalar()
+            session.execute(text("PRAGMA synchronous=OFF"))
+            session.execute(text("PRAGMA journal_mode=MEMORY"))
+            # pysqlite doesn't open a transaction before DDL on its own
+            session.execute(text("BEGIN"))
+
         # Step 3: Create job_batches table
         print("\nStep 3: Creating job_batches table...")
         session.execute(text("""
@@ -105,92 +231,63 @@ def migrate(dry_run: bool = False) -> bool:
                 FOREIGN KEY (job_id) REFERENCES polling_jobs(id) ON DELETE CASCADE
             )
         """))
-        session.commit()
         print("✓ job_batches table created")
 
         # Step 4: Migrate data
         print("\nStep 4: Migrating batch_id data to job_batches...")
         migrated_count = 0
-        for job_id, batch_id in existing_jobs:
+        created_at = datetime.now(timezone.utc)
+        # Stream existing rows in chunks instead of materializing them all
+        existing_jobs = session.execute(
+            text("SELECT id, batch_id FROM polling_jobs"),
+            execution_options={"yield_per": MIGRATION_CHUNK_SIZE},
+        )
+        for chunk in existing_jobs.partitions():
+            batch_rows = [
+                {
+                    "job_id": job_id,
+                    "batch_id": batch_id,
+                    "status": "in_progress",
+                    "created_at": created_at
+                }
+                for job_id, batch_id in chunk
+            ]
+            # A list of parameter dicts makes SQLAlchemy use executemany
             session.execute(text("""
                 INSERT INTO job_batches (job_id, batch_id, status, created_at)
                 VALUES (:job_id, :batch_id, 'in_progress', :created_at)
-            """), {
-                "job_id": job_id,
-                "batch_id": batch_id,
-                "status": "in_progress",
-                "created_at": datetime.now(timezone.utc)
-            })
-            migrated_count += 1
+            """), batch_rows)
+            migrated_count += len(batch_rows)
 
-        session.commit()
         print(f"✓ Migrated {migrated_count} batch_id records to job_batches")
 
-        # Step 5: Recreate polling_jobs table (SQLite can't drop columns)
-        print("\nStep 5: Recreating polling_jobs table without batch_id...")
-
-        # Backup existing data
-        result = session.execute(text("""
-            SELECT id, name, openai_secret_id, keboola_secret_id,
-                   keboola_stack_url, keboola_component_id, keboola_configuration_id,
-                   poll_interval_seconds, status, last_check_at, next_check_at,
-                   created_at, completed_at
-            FROM polling_jobs
-        """))
-        jobs_data = result.fetchall()
-
-        # Drop and recreate
-        session.execute(text("DROP TABLE polling_jobs"))
-        session.execute(text("""
-            CREATE TABLE polling_jobs (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name VARCHAR(255) NOT NULL,
-                openai_secret_id INTEGER,
-                keboola_secret_id INTEGER,
-                keboola_stack_url VARCHAR(500) NOT NULL,
-                keboola_component_id VARCHAR(255) NOT NULL,
-                keboola_configuration_id VARCHAR(255) NOT NULL,
-                poll_interval_seconds INTEGER NOT NULL DEFAULT 120,
-                status VARCHAR(50) NOT NULL DEFAULT 'active',
-                last_check_at DATETIME,
-                next_check_at DATETIME,
-                created_at DATETIME NOT NULL,
-                completed_at DATETIME,
-                FOREIGN KEY (openai_secret_id) REFERENCES secrets(id) ON DELETE SET NULL,
-                FOREIGN KEY (keboola_secret_id) REFERENCES secrets(id) ON DELETE SET NULL
-            )
-        """))
-
-        # Restore data
-        for row in jobs_data:
-            session.execute(text("""
-                INSERT INTO polling_jobs
-                (id, name, openai_secret_id, keboola_secret_id,
-                 keboola_stack_url, keboola_component_id, keboola_configuration_id,
-                 poll_interval_seconds, status, last_check_at, next_check_at,
-                 created_at, completed_at)
-                VALUES
-                (:id, :name, :openai_secret_id, :keboola_secret_id,
-                 :keboola_stack_url, :keboola_component_id, :keboola_configuration_id,
-                 :poll_interval_seconds, :status, :last_check_at, :next_check_at,
-                 :created_at, :completed_at)
-            """), {
-                "id": row[0], "name": row[1], "openai_secret_id": row[2],
-                "keboola_secret_id": row[3], "keboola_stack_url": row[4],
-                "keboola_component_id": row[5], "keboola_configuration_id": row[6],
-                "poll_interval_seconds": row[7], "status": row[8],
-                "last_check_at": row[9], "next_check_at": row[10],
-                "created_at": row[11], "completed_at": row[12]
-            })
-
-        session.commit()
-        print("✓ polling_jobs table recreated without batch_id column")
+        # Step 5: Remove batch_id from polling_jobs
+        if is_sqlite and _can_drop_batch_id_in_place(
+            session, polling_job_columns, polling_job_foreign_keys
+        ):
+            print("\nStep 5: Dropping batch_id column from polling_jobs...")
+            _drop_batch_id_indexes(session)
+            session.execute(text("ALTER TABLE polling_jobs DROP COLUMN batch_id"))
+            session.execute(text(
+                "ALTER TABLE polling_jobs ADD COLUMN unchanged_checks INTEGER NOT NULL DEFAULT 0"
+            ))
+            print("✓ batch_id column dropped from polling_jobs")
+        else:
+            print("\nStep 5: Recreating polling_jobs table without batch_id...")
+            _recreate_polling_jobs(session)
+            print("✓ polling_jobs table recreated without batch_id column")
 
         # Step 6: Create indexes
         print("\nStep 6: Creating indexes...")
         session.execute(text("CREATE INDEX IF NOT EXISTS idx_batch_job_id ON job_batches (job_id)"))
         session.execute(text("CREATE INDEX IF NOT EXISTS idx_batch_batch_id ON job_batches (batch_id)"))
-        session.execute(text("CREATE INDEX IF NOT EXISTS idx_batch_status ON job_batches (status)"))
+        # Covering index for status lookups per job: the polling query is an
+        # index-only scan and status-only filters still use its leftmost column
+        session.execute(text("DROP INDEX IF EXISTS idx_batch_status"))
+        session.execute(text(
+            "CREATE INDEX IF NOT EXISTS idx_batch_status_job "
+            "ON job_batches (status, job_id, batch_id)"
+        ))
         session.execute(text("CREATE UNIQUE INDEX IF NOT EXISTS idx_batch_job_batch_unique ON job_batches (job_id, batch_id)"))
         session.execute(text("CREATE INDEX IF NOT EXISTS idx_job_status_next_check ON polling_jobs (status, next_check_at)"))
         session.commit()
@@ -219,7 +316,15 @@ def migrate(dry_run: bool = False) -> bool:
         return False
 
     finally:
+        # Restore the journal mode whether the migration committed or rolled back
+        if journal_mode:
+            try:
+                session.execute(text(f"PRAGMA journal_mode={journal_mode}"))
+            except Exception as e:
+                print(f"⚠️  WARNING: could not restore journal_mode={journal_mode}: {e}")
         session.close()
+        # Release pooled connections even when the migration failed
+        engine.dispose()
 
 
 if __name__ == "__main__":
@@ -20,6 +20,7 @@ Usage:
 """
 
 import argparse
+import atexit
 import json
 import sys
 from typing import List, Optional
@@ -27,7 +28,6 @@ from typing import List, Optional
 import httpx
 from rich.console import Console
 from rich.panel import Panel
-from rich.syntax import Syntax
 from rich.table import Table
 
 console = Console()
@@ -39,6 +39,18 @@ DEFAULT_POLL_INTERVAL = 60
 DEFAULT_KEBOOLA_CONFIG_ID = "12345"
 DEFAULT_KEBOOLA_BRANCH_ID = "67890"
 
+# Shared HTTP client, created on first use so retries reuse the connection
+_CLIENT: Optional[httpx.Client] = None
+
+
+def get_client() -> httpx.Client:
+    """Return the shared HTTP client, creating it on first use."""
+    global _CLIENT
+    if _CLIENT is None:
+        _CLIENT = httpx.Client(timeout=10.0)
+        atexit.register(_CLIENT.close)
+    return _CLIENT
+
 
 def create_polling_job(
     api_url: str,
@@ -83,14 +95,19 @@ def create_polling_job(
 
     # Show request payload
     console.print("\n[bold]Request Payload:[/bold]")
-    syntax = Syntax(json.dumps(payload, indent=2), "json", theme="monokai")
-    console.print(syntax)
+    pretty = json.dumps(payload, indent=2)
+    if console.is_terminal:
+        # Pygments is only worth loading when the output is actually highlighted
+        from rich.syntax import Syntax
+
+        console.print(Syntax(pretty, "json", theme="monokai"))
+    else:
+        console.print(pretty, markup=False, highlight=False)
 
     try:
-        with httpx.Client(timeout=10.0) as client:
-            response = client.post(f"{api_url}/api/jobs", json=payload)
-            response.raise_for_status()
-            return response.json()
+        response = get_client().post(f"{api_url}/api/jobs", json=payload)
+        response.raise_for_status()
+        return response.json()
 
     except httpx.ConnectError:
         console.print(
@@ -116,32 +133,41 @@ def display_result(job_data: dict) -> None:
     """Display the created job in a nice format."""
     console.print("\n[bold green]✓ Job Created Successfully![/bold green]\n")
 
-    # Main job info table
-    table = Table(title="Polling Job Details", show_header=True)
-    table.add_column("Field", style="cyan", no_wrap=True)
-    table.add_column("Value", style="green")
-
-    table.add_row("Job ID", str(job_data.get("id")))
-    table.add_row("Status", job_data.get("status", "unknown"))
-    table.add_row("Created At", job_data.get("created_at", ""))
-    table.add_row("Poll Interval", f"{job_data.get('poll_interval')}s")
-
-    # Batch information
     batches = job_data.get("batches", [])
     batch_ids = [b.get("batch_id") for b in batches]
-    table.add_row("Batch Count", str(len(batches)))
-    table.add_row("Batch IDs", "\n".join(batch_ids) if batch_ids else "N/A")
-
-    # Completion counts
-    table.add_row("Completed", str(job_data.get("completed_count", 0)))
-    table.add_row("Failed", str(job_data.get("failed_count", 0)))
-
-    # Keboola config
-    table.add_row("Keboola Config ID", job_data.get("keboola_config_id", ""))
+    batch_sep = "\n" if console.is_terminal else ", "
+
+    rows = [
+        ("Job ID", str(job_data.get("id"))),
+        ("Status", job_data.get("status", "unknown")),
+        ("Created At", job_data.get("created_at", "")),
+        ("Poll Interval", f"{job_data.get('poll_interval')}s"),
+        # Batch information
+        ("Batch Count", str(len(batches))),
+        ("Batch IDs", batch_sep.join(batch_ids) if batch_ids else "N/A"),
+        # Completion counts
+        ("Completed", str(job_data.get("completed_count", 0))),
+        ("Failed", str(job_data.get("failed_count", 0))),
+        # Keboola config
+        ("Keboola Config ID", job_data.get("keboola_config_id", "")),
+    ]
     if job_data.get("keboola_branch_id"):
-        table.add_row("Keboola Branch ID", job_data.get("keboola_branch_id"))
-
-    console.print(table)
+        rows.append(("Keboola Branch ID", job_data.get("keboola_branch_id")))
+
+    if console.is_terminal:
+        # Main job info table
+        table = Table(title="Polling Job Details", show_header=True)
+        table.add_column("Field", style="cyan", no_wrap=True)
+        table.add_column("Value", style="green")
+        for field, value in rows:
+            table.add_row(field, value)
+        console.print(table)
+    else:
+        console.print(
+            "\n".join(f"{field}: {value}" for field, value in rows),
+            markup=False,
+            highlight=False,
+        )
 
     # Next steps
     console.print("\n[bold]Next Steps:[/bold]")
@@ -22,9 +22,14 @@ Usage:
 
     # Simulate partial failure
     python scripts/test_trigger_keboola.py --with-failures
+
+Requests go over HTTP/2 when the optional h2 package is installed
+(pip install "httpx[http2]"); otherwise HTTP/1.1 keep-alive is used.
 """
 
 import argparse
+import atexit
+import importlib.util
 import json
 import os
 import sys
@@ -33,17 +38,79 @@ from typing import List, Optional
 import httpx
 from rich.console import Console
 from rich.panel import Panel
-from rich.syntax import Syntax
 from rich.table import Table
 
+try:
+    import orjson
+
+    json_dumps_bytes = orjson.dumps
+    json_loads = orjson.loads
+
+    def json_dumps_pretty(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+except ImportError:  # orjson is optional; fall back to the stdlib
+
+    def json_dumps_bytes(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+    json_loads = json.loads
+
+    def json_dumps_pretty(obj) -> str:
+        return json.dumps(obj, indent=2)
+
+
 console = Console()
 
+
+def print_json(data) -> None:
+    """Print JSON, highlighted only when the console is a terminal."""
+    pretty = json_dumps_pretty(data)
+    if console.is_terminal:
+        # Pygments is only worth loading when the output is actually highlighted
+        from rich.syntax import Syntax
+
+        console.print(Syntax(pretty, "json", theme="monokai"))
+    else:
+        console.print(pretty, markup=False, highlight=False)
+
 # Default configuration
 DEFAULT_KEBOOLA_API_URL = "https://queue.eu-central-1.keboola.com/jobs"
 DEFAULT_CONFIG_ID = "01k88kpabsjpv5qqxcn0dg69pm"
 DEFAULT_COMPONENT = "kds-team.app-custom-python"
 DEFAULT_TECKOCHECKER_API_URL = "http://localhost:8000"
 
+# HTTP/2 needs the optional 'h2' package (pip install httpx[http2])
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Shared HTTP client so TeckoChecker and Keboola calls reuse pooled connections
+_CLIENT: Optional[httpx.Client] = None
+
+
+def get_client() -> httpx.Client:
+    """Return the shared HTTP client, creating it on first use."""
+    global _CLIENT
+    if _CLIENT is None:
+        _CLIENT = httpx.Client(
+            timeout=30.0,
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_keepalive_connections=20, max_connections=50, keepalive_expiry=30.0
+            ),
+        )
+        atexit.register(_CLIENT.close)
+    return _CLIENT
+
+
+def exit_with_http_error(response: httpx.Response) -> None:
+    """Print an error response (JSON if possible) and exit."""
+    console.print(f"\n[bold red]Error {response.status_code}:[/bold red]")
+    try:
+        console.print(json_dumps_pretty(json_loads(response.content)))
+    except ValueError:
+        console.print(response.text)
+    sys.exit(1)
+
 
 def get_keboola_token_from_teckochecker(
     api_url: str, secret_id: int
@@ -61,35 +128,35 @@ def get_keboola_token_from_teckochecker(
     console.print(f"\n[cyan]Fetching secret {secret_id} from TeckoChecker...[/cyan]")
 
     try:
-        with httpx.Client(timeout=10.0) as client:
-            response = client.get(f"{api_url}/api/admin/secrets/{secret_id}")
-            response.raise_for_status()
-            secret = response.json()
-
-            if secret.get("type") != "keboola":
-                console.print(
-                    f"[bold red]Error:[/bold red] Secret {secret_id} is not a Keboola secret (type: {secret.get('type')})",
-                    style="red",
-                )
-                sys.exit(1)
-
-            # Get decrypted values
-            token = secret.get("value")
-            metadata = secret.get("metadata", {})
-            config_id = metadata.get("config_id")
-            branch_id = metadata.get("branch_id")
-
-            if not token:
-                console.print(
-                    "[bold red]Error:[/bold red] Secret has no token value", style="red"
-                )
-                sys.exit(1)
-
-            console.print(f"[green]✓ Retrieved Keboola secret[/green]")
-            console.print(f"  Config ID: {config_id or 'not set'}")
-            console.print(f"  Branch ID: {branch_id or 'not set'}")
-
-            return token, config_id, branch_id
+        response = get_client().get(f"{api_url}/api/admin/secrets/{secret_id}", timeout=10.0)
+        if response.is_error:
+            exit_with_http_error(response)
+        secret = json_loads(response.content)
+
+        if secret.get("type") != "keboola":
+            console.print(
+                f"[bold red]Error:[/bold red] Secret {secret_id} is not a Keboola secret (type: {secret.get('type')})",
+                style="red",
+            )
+            sys.exit(1)
+
+        # Get decrypted values
+        token = secret.get("value")
+        metadata = secret.get("metadata", {})
+        config_id = metadata.get("config_id")
+        branch_id = metadata.get("branch_id")
+
+        if not token:
+            console.print(
+                "[bold red]Error:[/bold red] Secret has no token value", style="red"
+            )
+            sys.exit(1)
+
+        console.print(f"[green]✓ Retrieved Keboola secret[/green]")
+        console.print(f"  Config ID: {config_id or 'not set'}")
+        console.print(f"  Branch ID: {branch_id or 'not set'}")
+
+        return token, config_id, branch_id
 
     except httpx.ConnectError:
         console.print(
@@ -101,15 +168,6 @@ def get_keboola_token_from_teckochecker(
         console.print("  - Docker: make docker-compose-up")
         sys.exit(1)
 
-    except httpx.HTTPStatusError as e:
-        console.print(f"\n[bold red]Error {e.response.status_code}:[/bold red]")
-        try:
-            error_data = e.response.json()
-            console.print(json.dumps(error_data, indent=2))
-        except Exception:
-            console.print(e.response.text)
-        sys.exit(1)
-
 
 def trigger_keboola_job(
     api_url: str,
@@ -161,37 +219,29 @@ def trigger_keboola_job(
     if branch_id:
         payload["branchId"] = branch_id
 
-    headers = {"X-StorageApi-Token": token}
+    headers = {"X-StorageApi-Token": token, "Content-Type": "application/json"}
 
-    console.print("\n[bold cyan]Triggering Keboola Job...[/bold cyan]")
-    console.print(f"API URL: {api_url}")
-    console.print(f"Component: {component}")
-    console.print(f"Config ID: {config_id}")
+    lines = [
+        "\n[bold cyan]Triggering Keboola Job...[/bold cyan]",
+        f"API URL: {api_url}",
+        f"Component: {component}",
+        f"Config ID: {config_id}",
+    ]
     if branch_id:
-        console.print(f"Branch ID: {branch_id}")
+        lines.append(f"Branch ID: {branch_id}")
+    console.print("\n".join(lines))
 
     # Show payload (with masked token)
     console.print("\n[bold]Request Payload:[/bold]")
-    syntax = Syntax(json.dumps(payload, indent=2), "json", theme="monokai")
-    console.print(syntax)
+    print_json(payload)
 
     console.print("\n[bold]Headers:[/bold]")
     console.print(f"X-StorageApi-Token: {'*' * 20}...{token[-4:]}")
 
-    try:
-        with httpx.Client(timeout=30.0) as client:
-            response = client.post(api_url, json=payload, headers=headers)
-            response.raise_for_status()
-            return response.json()
-
-    except httpx.HTTPStatusError as e:
-        console.print(f"\n[bold red]Error {e.response.status_code}:[/bold red]")
-        try:
-            error_data = e.response.json()
-            console.print(json.dumps(error_data, indent=2))
-        except Exception:
-            console.print(e.response.text)
-        sys.exit(1)
+    response = get_client().post(api_url, content=json_dumps_bytes(payload), headers=headers)
+    if response.is_error:
+        exit_with_http_error(response)
+    return json_loads(response.content)
 
 
 def display_result(result: dict) -> None:
@@ -211,8 +261,7 @@ def display_result(result: dict) -> None:
 
     # Full response
     console.print("\n[bold]Full Response:[/bold]")
-    syntax = Syntax(json.dumps(result, indent=2), "json", theme="monokai")
-    console.print(syntax)
+    print_json(result)
 
     # Next steps
     if result.get("url"):
@@ -220,7 +269,8 @@ def display_result(result: dict) -> None:
         console.print(f"  • Job URL: {result['url']}")
 
 
-def main():
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser."""
     parser = argparse.ArgumentParser(
         description="Test script for triggering Keboola jobs directly",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -318,7 +368,15 @@ Examples:
         help="Test with 2 completed and 1 failed batch",
     )
 
-    args = parser.parse_args()
+    return parser
+
+
+# Built once at import; main() only parses
+_PARSER = build_parser()
+
+
+def main():
+    args = _PARSER.parse_args()
 
     # Show banner
     console.print(
@@ -371,10 +429,12 @@ Examples:
         batch_ids_failed = []
 
     # Show summary
-    console.print(f"\n[bold]Test Configuration:[/bold]")
-    console.print(f"  Completed batches: {len(batch_ids_completed)}")
-    console.print(f"  Failed batches: {len(batch_ids_failed)}")
-    console.print(f"  Total batches: {len(batch_ids_completed) + len(batch_ids_failed)}")
+    console.print(
+        "\n[bold]Test Configuration:[/bold]\n"
+        f"  Completed batches: {len(batch_ids_completed)}\n"
+        f"  Failed batches: {len(batch_ids_failed)}\n"
+        f"  Total batches: {len(batch_ids_completed) + len(batch_ids_failed)}"
+    )
 
     # Trigger the job
     result = trigger_keboola_job(
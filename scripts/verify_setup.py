@@ -3,6 +3,7 @@
 Verification script to test TeckoChecker setup.
 Checks configuration, database connection, and models.
 """
+import importlib.util
 import sys
 from pathlib import Path
 
@@ -12,9 +13,8 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 def print_header(text: str):
     """Print a formatted header."""
-    print("\n" + "=" * 60)
-    print(f"  {text}")
-    print("=" * 60)
+    rule = "=" * 60
+    print(f"\n{rule}\n  {text}\n{rule}")
 
 
 def check_environment():
@@ -71,9 +71,7 @@ def check_database():
 
     try:
         from app.database import get_db_manager
-        from app.config import get_settings
 
-        settings = get_settings()
         db_manager = get_db_manager()
 
         # Check connection
@@ -152,12 +150,12 @@ def check_dependencies():
 
     all_installed = True
     for package, name in required_packages:
-        try:
-            __import__(package)
-            print(f"✓ {name}")
-        except ImportError:
+        # find_spec locates the package without executing its top-level code
+        if importlib.util.find_spec(package) is None:
             print(f"✗ {name} (not installed)")
             all_installed = False
+        else:
+            print(f"✓ {name}")
 
     if not all_installed:
         print("\nInstall missing packages with:")
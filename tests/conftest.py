@@ -0,0 +1,134 @@
+"""
+Shared pytest fixtures for TeckoChecker tests.
+
+Provides an in-memory SQLite engine whose schema is created once per test
+session. Each test runs inside an outer transaction that is rolled back on
+teardown, and sessions commit to SAVEPOINTs inside it, so tests never see
+each other's writes. API tests route the app's get_db dependency to the
+same session through app_db_session.
+"""
+
+from typing import Optional
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.database import Base, get_db
+
+
+@pytest.fixture(scope="session")
+def db_engine():
+    """
+    Create an in-memory SQLite database engine shared by the whole session.
+
+    The schema is created once; tests isolate their writes by rolling back
+    an outer transaction (see db_connection).
+    """
+    # Create in-memory SQLite database with static pool
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,  # Use static pool for in-memory DB
+        echo=False,
+    )
+
+    # Let SQLAlchemy emit BEGIN itself so SAVEPOINTs work under pysqlite,
+    # and skip durability bookkeeping the throwaway test DB doesn't need
+    @event.listens_for(engine, "connect")
+    def _configure_test_sqlite(dbapi_conn, connection_record):
+        dbapi_conn.isolation_level = None
+        cursor = dbapi_conn.cursor()
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA journal_mode=MEMORY")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    # Create all tables
+    Base.metadata.create_all(bind=engine)
+
+    yield engine
+
+    # Cleanup
+    Base.metadata.drop_all(bind=engine)
+    engine.dispose()
+
+
+@pytest.fixture
+def db_connection(db_engine):
+    """Open a connection with an outer transaction rolled back after each test."""
+    connection = db_engine.connect()
+    transaction = connection.begin()
+    try:
+        yield connection
+    finally:
+        transaction.rollback()
+        connection.close()
+
+
+@pytest.fixture
+def db_session_factory(db_connection):
+    """Create a database session factory bound to the test transaction."""
+    # Session commits release a SAVEPOINT instead of ending the outer transaction
+    SessionLocal = sessionmaker(
+        autocommit=False,
+        autoflush=False,
+        bind=db_connection,
+        join_transaction_mode="create_savepoint",
+    )
+
+    def factory():
+        session = SessionLocal()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    return factory
+
+
+@pytest.fixture
+def db_session(db_session_factory):
+    """Create a database session whose writes are rolled back after each test."""
+    session_gen = db_session_factory()
+    session = next(session_gen)
+    yield session
+    try:
+        next(session_gen)
+    except StopIteration:
+        pass
+    finally:
+        session.close()
+
+
+# Session handed to the app by the get_db override; set per test by app_db_session
+_current_db_session: Optional[Session] = None
+
+
+def _override_get_db():
+    yield _current_db_session
+
+
+@pytest.fixture(scope="module")
+def app_db_override():
+    """Register the get_db override once per module, removing only that key after."""
+    from app.main import app
+
+    app.dependency_overrides[get_db] = _override_get_db
+    yield
+    app.dependency_overrides.pop(get_db, None)
+
+
+@pytest.fixture
+def app_db_session(app_db_override, db_session):
+    """Route the app's get_db dependency to this test's db_session."""
+    global _current_db_session
+
+    _current_db_session = db_session
+    yield db_session
+    _current_db_session = None
@@ -10,7 +10,7 @@ import sys
 # Add the app directory to the path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from sqlalchemy import text
+from sqlalchemy import func, select, text
 from app.config import get_settings
 from app.database import init_db, SessionLocal
 from app.models import Secret, PollingJob
@@ -35,16 +35,14 @@ def test_basic_flow():
     print("\n✓ Testing database connection...")
     init_db()
     with SessionLocal() as session:
-        # Test connection
-        result = session.execute(text("SELECT 1")).scalar()
-        assert result == 1, "Database connection failed"
+        # One round-trip proves connectivity and lists the tables
+        table_list = session.execute(
+            text("SELECT group_concat(name) FROM sqlite_master WHERE type='table'")
+        ).scalar()
+        assert table_list, "Database connection failed"
+        tables = table_list.split(",")
         print("  Database connected successfully")
-
-        # Count tables
-        tables = session.execute(
-            text("SELECT name FROM sqlite_master WHERE type='table'")
-        ).fetchall()
-        print(f"  Found {len(tables)} tables: {[t[0] for t in tables]}")
+        print(f"  Found {len(tables)} tables: {tables}")
 
     # 3. Test encryption service
     print("\n✓ Testing encryption service...")
@@ -62,7 +60,8 @@ def test_basic_flow():
 
     # 4. Test secret management
     print("\n✓ Testing secret management...")
-    with SessionLocal() as session:
+    # One transaction for the whole section; the manager only flushes
+    with SessionLocal() as session, session.begin():
         secret_manager = SecretManager(session)
 
         # Create a test secret
@@ -73,11 +72,11 @@ def test_basic_flow():
         # Check if secret already exists and delete it
         existing = secret_manager.get_secret_by_name("test-openai")
         if existing:
-            secret_manager.delete_secret(existing.id, force=True)
+            secret_manager.delete_secret(existing.id, force=True, commit=False)
             print("  Cleaned up existing test secret")
 
         # Create new secret
-        created_secret = secret_manager.create_secret(secret_data)
+        created_secret = secret_manager.create_secret(secret_data, commit=False)
         print(f"  Created secret: ID={created_secret.id}, Name={created_secret.name}")
 
         # Retrieve and decrypt
@@ -97,15 +96,19 @@ def test_basic_flow():
         print(f"  Total secrets in database: {secret_count}")
 
         # Cleanup
-        secret_manager.delete_secret(created_secret.id, force=True)
+        secret_manager.delete_secret(created_secret.id, force=True, commit=False)
         print("  Test secret cleaned up")
 
     # 5. Test models
     print("\n✓ Testing database models...")
     with SessionLocal() as session:
-        # Count records
-        secret_count = session.query(Secret).count()
-        job_count = session.query(PollingJob).count()
+        # Count records for both models in a single statement
+        secret_count, job_count = session.execute(
+            select(
+                select(func.count()).select_from(Secret).scalar_subquery(),
+                select(func.count()).select_from(PollingJob).scalar_subquery(),
+            )
+        ).one()
         print(f"  Secrets in DB: {secret_count}")
         print(f"  Polling jobs in DB: {job_count}")
 
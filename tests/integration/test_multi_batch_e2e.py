@@ -16,22 +16,17 @@ Test Framework:
 """
 
 import pytest
-import pytest_asyncio
 import asyncio
+import functools
 import time
 from datetime import datetime, timezone
 from typing import List, Dict, Any
 from unittest.mock import AsyncMock, patch, Mock
 from httpx import AsyncClient, ASGITransport
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
-
 from app.main import app
-from app.database import get_db, Base
 from app.models import Secret, PollingJob, JobBatch, PollingLog
-from app.services.encryption import init_encryption_service
+from app.services.encryption import get_encryption_service, init_encryption_service
 from app.services.polling import PollingService
 
 
@@ -40,117 +35,73 @@ from app.services.polling import PollingService
 # ============================================================================
 
 
-@pytest.fixture
-def encryption_key():
-    """Generate a test encryption key."""
-    return "test-multi-batch-encryption-key-12345"
+ENCRYPTION_KEY = "test-multi-batch-encryption-key-12345"
 
 
-@pytest.fixture(scope="function")
-def db_engine(encryption_key):
-    """Create an in-memory SQLite database engine."""
-    # Initialize encryption service first
-    init_encryption_service(encryption_key)
+@functools.lru_cache(maxsize=32)
+def _enc(plaintext: str) -> str:
+    """Encrypt a fixture value once; ENCRYPTION_KEY is fixed for this module."""
+    return get_encryption_service().encrypt(plaintext)
 
-    # Create in-memory SQLite database with static pool
-    engine = create_engine(
-        "sqlite:///:memory:",
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-        echo=False,
-    )
 
-    # Create all tables
-    Base.metadata.create_all(bind=engine)
+@pytest.fixture
+def encryption_key():
+    """Generate a test encryption key."""
+    return ENCRYPTION_KEY
 
-    yield engine
 
-    # Cleanup
-    Base.metadata.drop_all(bind=engine)
-    engine.dispose()
+@pytest.fixture(scope="module", autouse=True)
+def encryption_service_init():
+    """Initialize the encryption service once for the module."""
+    init_encryption_service(ENCRYPTION_KEY)
 
 
-@pytest.fixture
-def db_session_factory(db_engine):
-    """Create a database session factory."""
-    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=db_engine)
+# The app instance is shared, so one transport serves every test
+_TRANSPORT = ASGITransport(app=app)
 
-    def factory():
-        session = SessionLocal()
-        try:
-            yield session
-        finally:
-            session.close()
 
-    return factory
+@pytest.fixture(scope="module")
+def shared_async_client():
+    """Build one AsyncClient for the module; tests only swap the DB override."""
+    client = AsyncClient(transport=_TRANSPORT, base_url="http://test")
+    yield client
+    asyncio.run(client.aclose())
 
 
 @pytest.fixture
-def db_session(db_session_factory):
-    """Create a database session for tests."""
-    session_gen = db_session_factory()
-    session = next(session_gen)
-    yield session
-    try:
-        next(session_gen)
-    except StopIteration:
-        pass
-    finally:
-        session.close()
-
-
-@pytest_asyncio.fixture
-async def async_client(db_session):
+def async_client(shared_async_client, app_db_session):
     """Create an async HTTP client for API testing."""
-
-    def override_get_db():
-        try:
-            yield db_session
-        finally:
-            pass
-
-    app.dependency_overrides[get_db] = override_get_db
-
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
-        yield client
-
-    app.dependency_overrides.clear()
+    return shared_async_client
 
 
 @pytest.fixture
-def openai_secret(db_session, encryption_key):
-    """Create a test OpenAI secret."""
-    from app.services.encryption import get_encryption_service
-
-    encryption_service = get_encryption_service()
-
-    secret = Secret(
+def multi_batch_secrets(db_session, encryption_key):
+    """Create the OpenAI and Keboola test secrets in a single commit."""
+    openai = Secret(
         name="test-openai-multi-batch",
         type="openai",
-        value=encryption_service.encrypt("sk-test-multi-batch-key-123")
+        value=_enc("sk-test-multi-batch-key-123")
     )
-    db_session.add(secret)
+    keboola = Secret(
+        name="test-keboola-multi-batch",
+        type="keboola",
+        value=_enc("kbc-multi-batch-token-456")
+    )
+    db_session.add_all([openai, keboola])
     db_session.commit()
-    db_session.refresh(secret)
-    return secret
+    return openai, keboola
 
 
 @pytest.fixture
-def keboola_secret(db_session, encryption_key):
-    """Create a test Keboola secret."""
-    from app.services.encryption import get_encryption_service
+def openai_secret(multi_batch_secrets):
+    """Create a test OpenAI secret."""
+    return multi_batch_secrets[0]
 
-    encryption_service = get_encryption_service()
 
-    secret = Secret(
-        name="test-keboola-multi-batch",
-        type="keboola",
-        value=encryption_service.encrypt("kbc-multi-batch-token-456")
-    )
-    db_session.add(secret)
-    db_session.commit()
-    db_session.refresh(secret)
-    return secret
+@pytest.fixture
+def keboola_secret(multi_batch_secrets):
+    """Create a test Keboola secret."""
+    return multi_batch_secrets[1]
 
 
 @pytest.fixture
@@ -212,7 +163,7 @@ class TestMultiBatchJobLifecycle:
         job_id = data["id"]
 
         # Step 2: Verify JobBatch records created
-        job = db_session.query(PollingJob).filter(PollingJob.id == job_id).first()
+        job = db_session.get(PollingJob, job_id)
         assert job is not None
         assert len(job.batches) == 3
 
@@ -290,7 +241,7 @@ class TestMultiBatchJobLifecycle:
 
             # Refresh job from DB to get updated batch statuses
             db_session.expire(job)
-            job = db_session.query(PollingJob).filter(PollingJob.id == job_id).first()
+            job = db_session.get(PollingJob, job_id)
 
             # Process the job (second round - all batches should complete)
             await polling_service._process_single_job(job)
@@ -396,7 +347,7 @@ class TestMultiBatchPartialFailure:
             mock_get_keboola.return_value = mock_keboola_client
 
             # Get job and process
-            job = db_session.query(PollingJob).filter(PollingJob.id == job_id).first()
+            job = db_session.get(PollingJob, job_id)
             await polling_service._process_single_job(job)
 
             # Verify Keboola was triggered
@@ -659,7 +610,7 @@ class TestMultiBatchConcurrentChecking:
             mock_client.check_batch_status = AsyncMock(side_effect=mock_check_with_tracking)
             mock_get_openai.return_value = mock_client
 
-            job = db_session.query(PollingJob).filter(PollingJob.id == job_id).first()
+            job = db_session.get(PollingJob, job_id)
             await polling_service._process_single_job(job)
 
         elapsed_time = time.time() - start_time
@@ -733,7 +684,7 @@ class TestMultiBatchEdgeCases:
             mock_keboola_client.trigger_job = AsyncMock(return_value={"job_id": "kb_fail_999"})
             mock_get_keboola.return_value = mock_keboola_client
 
-            job = db_session.query(PollingJob).filter(PollingJob.id == job_id).first()
+            job = db_session.get(PollingJob, job_id)
             await polling_service._process_single_job(job)
 
             # Verify Keboola still triggered (to report failures)
@@ -831,7 +782,7 @@ class TestMultiBatchEdgeCases:
             mock_keboola_client.trigger_job = AsyncMock(return_value={"job_id": "kb_mixed_999"})
             mock_get_keboola.return_value = mock_keboola_client
 
-            job = db_session.query(PollingJob).filter(PollingJob.id == job_id).first()
+            job = db_session.get(PollingJob, job_id)
             await polling_service._process_single_job(job)
 
             # Verify proper categorization
@@ -901,7 +852,7 @@ class TestMultiBatchPerformance:
             mock_keboola_client.trigger_job = AsyncMock(return_value={"job_id": "perf_999"})
             mock_get_keboola.return_value = mock_keboola_client
 
-            job = db_session.query(PollingJob).filter(PollingJob.id == job_id).first()
+            job = db_session.get(PollingJob, job_id)
             await polling_service._process_single_job(job)
 
         elapsed = time.time() - start_time
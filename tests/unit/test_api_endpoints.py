@@ -10,17 +10,15 @@ This module tests:
 - Response schema validation
 """
 
+import asyncio
 import pytest
 from datetime import datetime, timedelta, timezone
-from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
+from httpx import AsyncClient, ASGITransport
 
 from app.main import app
-from app.database import get_db, Base
 from app.models import Secret, PollingJob, PollingLog
 from app.services.encryption import init_encryption_service
+from app.services.scheduler import JobScheduler
 
 
 # ============================================================================
@@ -28,91 +26,62 @@ from app.services.encryption import init_encryption_service
 # ============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def encryption_key():
     """Generate a test encryption key."""
     return "test-secret-key-for-testing-purposes"
 
 
-@pytest.fixture(scope="function")
-def db_session(encryption_key):
-    """Create an in-memory SQLite database session for testing."""
-    # Initialize encryption service first
-    init_encryption_service(encryption_key)
+@pytest.fixture(scope="module", autouse=True)
+def encryption_service(encryption_key):
+    """
+    Initialize the encryption service once for this module.
 
-    # Create in-memory SQLite database with static pool
-    engine = create_engine(
-        "sqlite:///:memory:",
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,  # Use static pool for in-memory DB
-        echo=False,
-    )
+    Module rather than session scope: other test modules re-initialize the
+    global service with their own keys.
+    """
+    return init_encryption_service(encryption_key)
 
-    # Create all tables
-    Base.metadata.create_all(bind=engine)
 
-    # Create session factory
-    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-    session = SessionLocal()
+@pytest.fixture(scope="module")
+def encrypted_values(encryption_service):
+    """Encrypt the sample secret values once for the module."""
+    return {
+        "openai": encryption_service.encrypt("sk-test-key-12345"),
+        "keboola": encryption_service.encrypt("kbc-token-12345"),
+    }
 
-    yield session
 
-    # Cleanup
-    session.close()
-    Base.metadata.drop_all(bind=engine)
-    engine.dispose()
+@pytest.fixture(scope="module")
+def shared_client():
+    """Build one async API client for the module (requests run in-process)."""
+    test_client = AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+    yield test_client
+    asyncio.run(test_client.aclose())
 
 
 @pytest.fixture
-def client(db_session):
-    """Create a FastAPI test client with dependency override."""
-
-    def override_get_db():
-        try:
-            yield db_session
-        finally:
-            pass
-
-    app.dependency_overrides[get_db] = override_get_db
-
-    with TestClient(app) as test_client:
-        yield test_client
-
-    app.dependency_overrides.clear()
+def client(shared_client, app_db_session):
+    """Async API client whose requests use this test's db_session."""
+    return shared_client
 
 
 @pytest.fixture
-def sample_openai_secret(db_session, encryption_key):
+def sample_openai_secret(db_session, encrypted_values):
     """Create a sample OpenAI secret in the database."""
-    from app.services.encryption import get_encryption_service
-
-    encryption_service = get_encryption_service()
-
-    secret = Secret(
-        name="test-openai-key", type="openai", value=encryption_service.encrypt("sk-test-key-12345")
-    )
+    secret = Secret(name="test-openai-key", type="openai", value=encrypted_values["openai"])
     db_session.add(secret)
     db_session.commit()
-    db_session.refresh(secret)
     # Keep session open, don't expunge
     return secret
 
 
 @pytest.fixture
-def sample_keboola_secret(db_session, encryption_key):
+def sample_keboola_secret(db_session, encrypted_values):
     """Create a sample Keboola secret in the database."""
-    from app.services.encryption import get_encryption_service
-
-    encryption_service = get_encryption_service()
-
-    secret = Secret(
-        name="test-keboola-token",
-        type="keboola",
-        value=encryption_service.encrypt("kbc-token-12345"),
-    )
+    secret = Secret(name="test-keboola-token", type="keboola", value=encrypted_values["keboola"])
     db_session.add(secret)
     db_session.commit()
-    db_session.refresh(secret)
     # Keep session open, don't expunge
     return secret
 
@@ -132,20 +101,11 @@ def sample_job(db_session, sample_openai_secret, sample_keboola_secret):
         poll_interval_seconds=120,
         status="active",
         next_check_at=datetime.now(timezone.utc) + timedelta(seconds=120),
+        # Add a batch to the job (multi-batch schema)
+        batches=[JobBatch(batch_id="batch_abc123", status="in_progress")],
     )
     db_session.add(job)
     db_session.commit()
-    db_session.refresh(job)
-
-    # Add a batch to the job (multi-batch schema)
-    batch = JobBatch(
-        job_id=job.id,
-        batch_id="batch_abc123",
-        status="in_progress",
-    )
-    db_session.add(batch)
-    db_session.commit()
-    db_session.refresh(job)
 
     # Keep session open, don't expunge
     return job
@@ -156,12 +116,13 @@ def sample_job(db_session, sample_openai_secret, sample_keboola_secret):
 # ============================================================================
 
 
+@pytest.mark.asyncio
 class TestSystemEndpoints:
     """Test cases for system endpoints (/api/health, /api/stats)."""
 
-    def test_root_endpoint(self, client):
+    async def test_root_endpoint(self, client):
         """Test root endpoint returns API information."""
-        response = client.get("/")
+        response = await client.get("/")
 
         assert response.status_code == 200
         data = response.json()
@@ -171,9 +132,9 @@ class TestSystemEndpoints:
         assert data["docs"] == "/docs"
         assert data["health"] == "/api/health"
 
-    def test_health_check_success(self, client):
+    async def test_health_check_success(self, client):
         """Test health check endpoint returns healthy status."""
-        response = client.get("/api/health")
+        response = await client.get("/api/health")
 
         assert response.status_code == 200
         data = response.json()
@@ -182,9 +143,9 @@ class TestSystemEndpoints:
         assert data["version"] == "0.1.0"
         assert "timestamp" in data
 
-    def test_health_check_response_schema(self, client):
+    async def test_health_check_response_schema(self, client):
         """Test health check response matches schema."""
-        response = client.get("/api/health")
+        response = await client.get("/api/health")
 
         assert response.status_code == 200
         data = response.json()
@@ -192,9 +153,9 @@ class TestSystemEndpoints:
         for field in required_fields:
             assert field in data
 
-    def test_stats_empty_database(self, client):
+    async def test_stats_empty_database(self, client):
         """Test stats endpoint with empty database."""
-        response = client.get("/api/stats")
+        response = await client.get("/api/stats")
 
         assert response.status_code == 200
         data = response.json()
@@ -206,9 +167,9 @@ class TestSystemEndpoints:
         assert data["total_secrets"] == 0
         assert data["total_logs"] == 0
 
-    def test_stats_with_data(self, client, sample_job):
+    async def test_stats_with_data(self, client, sample_job):
         """Test stats endpoint with existing data."""
-        response = client.get("/api/stats")
+        response = await client.get("/api/stats")
 
         assert response.status_code == 200
         data = response.json()
@@ -217,16 +178,16 @@ class TestSystemEndpoints:
         assert data["total_secrets"] == 2  # OpenAI + Keboola from fixtures
         assert data["total_logs"] == 0
 
-    def test_stats_job_counts(
+    async def test_stats_job_counts(
         self, client, db_session, sample_openai_secret, sample_keboola_secret
     ):
         """Test stats correctly counts jobs by status."""
         from app.models import JobBatch
 
-        # Create jobs with different statuses
+        # Create jobs with different statuses, each with one batch
         statuses = ["active", "paused", "completed", "failed"]
-        for status in statuses:
-            job = PollingJob(
+        db_session.add_all(
+            PollingJob(
                 name=f"Job {status}",
                 openai_secret_id=sample_openai_secret.id,
                 keboola_secret_id=sample_keboola_secret.id,
@@ -234,21 +195,13 @@ class TestSystemEndpoints:
                 keboola_component_id="test-component",
                 keboola_configuration_id="12345",
                 status=status,
+                batches=[JobBatch(batch_id=f"batch_{status}", status="in_progress")],
             )
-            db_session.add(job)
-            db_session.flush()
-
-            # Add batch for each job
-            batch = JobBatch(
-                job_id=job.id,
-                batch_id=f"batch_{status}",
-                status="in_progress",
-            )
-            db_session.add(batch)
-
+            for status in statuses
+        )
         db_session.commit()
 
-        response = client.get("/api/stats")
+        response = await client.get("/api/stats")
 
         assert response.status_code == 200
         data = response.json()
@@ -264,14 +217,15 @@ class TestSystemEndpoints:
 # ============================================================================
 
 
+@pytest.mark.asyncio
 class TestSecretEndpoints:
     """Test cases for secret management endpoints (/api/admin/secrets)."""
 
-    def test_create_secret_openai(self, client):
+    async def test_create_secret_openai(self, client):
         """Test creating a new OpenAI secret."""
         secret_data = {"name": "production-openai", "type": "openai", "value": "sk-prod-key-12345"}
 
-        response = client.post("/api/admin/secrets", json=secret_data)
+        response = await client.post("/api/admin/secrets", json=secret_data)
 
         assert response.status_code == 201
         data = response.json()
@@ -281,68 +235,68 @@ class TestSecretEndpoints:
         assert "created_at" in data
         assert "value" not in data  # Value should not be returned
 
-    def test_create_secret_keboola(self, client):
+    async def test_create_secret_keboola(self, client):
         """Test creating a new Keboola secret."""
         secret_data = {"name": "production-keboola", "type": "keboola", "value": "kbc-token-67890"}
 
-        response = client.post("/api/admin/secrets", json=secret_data)
+        response = await client.post("/api/admin/secrets", json=secret_data)
 
         assert response.status_code == 201
         data = response.json()
         assert data["name"] == secret_data["name"]
         assert data["type"] == secret_data["type"]
 
-    def test_create_secret_invalid_type(self, client):
+    async def test_create_secret_invalid_type(self, client):
         """Test creating secret with invalid type."""
         secret_data = {"name": "invalid-secret", "type": "invalid_type", "value": "some-value"}
 
-        response = client.post("/api/admin/secrets", json=secret_data)
+        response = await client.post("/api/admin/secrets", json=secret_data)
 
         assert response.status_code == 422
         data = response.json()
         assert data["error"] == "validation_error"
 
-    def test_create_secret_duplicate_name(self, client, sample_openai_secret):
+    async def test_create_secret_duplicate_name(self, client, sample_openai_secret):
         """Test creating secret with duplicate name."""
         secret_data = {"name": sample_openai_secret.name, "type": "openai", "value": "another-key"}
 
-        response = client.post("/api/admin/secrets", json=secret_data)
+        response = await client.post("/api/admin/secrets", json=secret_data)
 
         assert response.status_code == 409
         data = response.json()
         assert "already exists" in data["detail"]
 
-    def test_create_secret_missing_fields(self, client):
+    async def test_create_secret_missing_fields(self, client):
         """Test creating secret with missing required fields."""
         secret_data = {
             "name": "incomplete-secret"
             # Missing type and value
         }
 
-        response = client.post("/api/admin/secrets", json=secret_data)
+        response = await client.post("/api/admin/secrets", json=secret_data)
 
         assert response.status_code == 422
 
-    def test_create_secret_empty_value(self, client):
+    async def test_create_secret_empty_value(self, client):
         """Test creating secret with empty value."""
         secret_data = {"name": "empty-secret", "type": "openai", "value": ""}
 
-        response = client.post("/api/admin/secrets", json=secret_data)
+        response = await client.post("/api/admin/secrets", json=secret_data)
 
         assert response.status_code == 422
 
-    def test_list_secrets_empty(self, client):
+    async def test_list_secrets_empty(self, client):
         """Test listing secrets when database is empty."""
-        response = client.get("/api/admin/secrets")
+        response = await client.get("/api/admin/secrets")
 
         assert response.status_code == 200
         data = response.json()
         assert data["total"] == 0
         assert data["secrets"] == []
 
-    def test_list_secrets(self, client, sample_openai_secret, sample_keboola_secret):
+    async def test_list_secrets(self, client, sample_openai_secret, sample_keboola_secret):
         """Test listing all secrets."""
-        response = client.get("/api/admin/secrets")
+        response = await client.get("/api/admin/secrets")
 
         assert response.status_code == 200
         data = response.json()
@@ -357,9 +311,9 @@ class TestSecretEndpoints:
             assert "created_at" in secret
             assert "value" not in secret
 
-    def test_list_secrets_response_schema(self, client, sample_openai_secret):
+    async def test_list_secrets_response_schema(self, client, sample_openai_secret):
         """Test list secrets response matches schema."""
-        response = client.get("/api/admin/secrets")
+        response = await client.get("/api/admin/secrets")
 
         assert response.status_code == 200
         data = response.json()
@@ -367,9 +321,9 @@ class TestSecretEndpoints:
         assert "total" in data
         assert isinstance(data["secrets"], list)
 
-    def test_get_secret_by_id(self, client, sample_openai_secret):
+    async def test_get_secret_by_id(self, client, sample_openai_secret):
         """Test retrieving a specific secret by ID."""
-        response = client.get(f"/api/admin/secrets/{sample_openai_secret.id}")
+        response = await client.get(f"/api/admin/secrets/{sample_openai_secret.id}")
 
         assert response.status_code == 200
         data = response.json()
@@ -378,18 +332,18 @@ class TestSecretEndpoints:
         assert data["type"] == sample_openai_secret.type
         assert "value" not in data
 
-    def test_get_secret_not_found(self, client):
+    async def test_get_secret_not_found(self, client):
         """Test retrieving non-existent secret."""
-        response = client.get("/api/admin/secrets/99999")
+        response = await client.get("/api/admin/secrets/99999")
 
         assert response.status_code == 404
         data = response.json()
         assert "not found" in data["detail"].lower()
         assert response.headers.get("X-Error-Code") == "1001"
 
-    def test_delete_secret(self, client, sample_openai_secret):
+    async def test_delete_secret(self, client, sample_openai_secret):
         """Test deleting a secret."""
-        response = client.delete(f"/api/admin/secrets/{sample_openai_secret.id}")
+        response = await client.delete(f"/api/admin/secrets/{sample_openai_secret.id}")
 
         assert response.status_code == 200
         data = response.json()
@@ -397,35 +351,35 @@ class TestSecretEndpoints:
         assert "deleted successfully" in data["message"]
 
         # Verify secret is deleted
-        get_response = client.get(f"/api/admin/secrets/{sample_openai_secret.id}")
+        get_response = await client.get(f"/api/admin/secrets/{sample_openai_secret.id}")
         assert get_response.status_code == 404
 
-    def test_delete_secret_not_found(self, client):
+    async def test_delete_secret_not_found(self, client):
         """Test deleting non-existent secret."""
-        response = client.delete("/api/admin/secrets/99999")
+        response = await client.delete("/api/admin/secrets/99999")
 
         assert response.status_code == 404
         data = response.json()
         assert "not found" in data["detail"].lower()
         assert response.headers.get("X-Error-Code") == "1001"
 
-    def test_delete_secret_in_use(self, client, sample_job):
+    async def test_delete_secret_in_use(self, client, sample_job):
         """Test deleting secret that is referenced by active job."""
         # Try to delete the OpenAI secret used by the job
-        response = client.delete(f"/api/admin/secrets/{sample_job.openai_secret_id}")
+        response = await client.delete(f"/api/admin/secrets/{sample_job.openai_secret_id}")
 
         assert response.status_code == 409
         data = response.json()
         assert "referenced by active jobs" in data["detail"]
 
-    def test_delete_secret_completed_job_ok(self, client, db_session, sample_job):
+    async def test_delete_secret_completed_job_ok(self, client, db_session, sample_job):
         """Test deleting secret referenced by completed job is allowed."""
         # Mark job as completed
         sample_job.status = "completed"
         db_session.commit()
 
         # Should be able to delete the secret now
-        response = client.delete(f"/api/admin/secrets/{sample_job.openai_secret_id}")
+        response = await client.delete(f"/api/admin/secrets/{sample_job.openai_secret_id}")
 
         # This should succeed since the job is not active/paused
         assert response.status_code == 200
@@ -436,10 +390,11 @@ class TestSecretEndpoints:
 # ============================================================================
 
 
+@pytest.mark.asyncio
 class TestJobEndpoints:
     """Test cases for job management endpoints (/api/jobs)."""
 
-    def test_create_job_success(self, client, sample_openai_secret, sample_keboola_secret):
+    async def test_create_job_success(self, client, sample_openai_secret, sample_keboola_secret):
         """Test creating a new polling job."""
         job_data = {
             "name": "My Test Job",
@@ -452,7 +407,7 @@ class TestJobEndpoints:
             "poll_interval_seconds": 180,
         }
 
-        response = client.post("/api/jobs", json=job_data)
+        response = await client.post("/api/jobs", json=job_data)
 
         assert response.status_code == 201
         data = response.json()
@@ -465,7 +420,7 @@ class TestJobEndpoints:
         assert "created_at" in data
         assert "next_check_at" in data
 
-    def test_create_job_default_poll_interval(
+    async def test_create_job_default_poll_interval(
         self, client, sample_openai_secret, sample_keboola_secret
     ):
         """Test creating job with default poll interval."""
@@ -480,13 +435,13 @@ class TestJobEndpoints:
             # poll_interval_seconds not provided
         }
 
-        response = client.post("/api/jobs", json=job_data)
+        response = await client.post("/api/jobs", json=job_data)
 
         assert response.status_code == 201
         data = response.json()
         assert data["poll_interval_seconds"] == 120  # Default value
 
-    def test_create_job_invalid_openai_secret(self, client, sample_keboola_secret):
+    async def test_create_job_invalid_openai_secret(self, client, sample_keboola_secret):
         """Test creating job with non-existent OpenAI secret."""
         job_data = {
             "name": "Invalid Job",
@@ -498,14 +453,14 @@ class TestJobEndpoints:
             "keboola_configuration_id": "12345",
         }
 
-        response = client.post("/api/jobs", json=job_data)
+        response = await client.post("/api/jobs", json=job_data)
 
         assert response.status_code == 404
         data = response.json()
         assert "OpenAI secret" in data["detail"]
         assert response.headers.get("X-Error-Code") == "1001"
 
-    def test_create_job_invalid_keboola_secret(self, client, sample_openai_secret):
+    async def test_create_job_invalid_keboola_secret(self, client, sample_openai_secret):
         """Test creating job with non-existent Keboola secret."""
         job_data = {
             "name": "Invalid Job",
@@ -517,13 +472,13 @@ class TestJobEndpoints:
             "keboola_configuration_id": "12345",
         }
 
-        response = client.post("/api/jobs", json=job_data)
+        response = await client.post("/api/jobs", json=job_data)
 
         assert response.status_code == 404
         data = response.json()
         assert "Keboola secret" in data["detail"]
 
-    def test_create_job_invalid_poll_interval(
+    async def test_create_job_invalid_poll_interval(
         self, client, sample_openai_secret, sample_keboola_secret
     ):
         """Test creating job with invalid poll interval."""
@@ -538,11 +493,11 @@ class TestJobEndpoints:
             "poll_interval_seconds": 10,  # Below minimum of 30
         }
 
-        response = client.post("/api/jobs", json=job_data)
+        response = await client.post("/api/jobs", json=job_data)
 
         assert response.status_code == 422
 
-    def test_create_job_creates_log_entry(
+    async def test_create_job_creates_log_entry(
         self, client, db_session, sample_openai_secret, sample_keboola_secret
     ):
         """Test that creating a job also creates initial log entry."""
@@ -556,7 +511,7 @@ class TestJobEndpoints:
             "keboola_configuration_id": "12345",
         }
 
-        response = client.post("/api/jobs", json=job_data)
+        response = await client.post("/api/jobs", json=job_data)
         assert response.status_code == 201
 
         job_id = response.json()["id"]
@@ -567,18 +522,18 @@ class TestJobEndpoints:
         assert log is not None
         assert log.status == "created"
 
-    def test_list_jobs_empty(self, client):
+    async def test_list_jobs_empty(self, client):
         """Test listing jobs when database is empty."""
-        response = client.get("/api/jobs")
+        response = await client.get("/api/jobs")
 
         assert response.status_code == 200
         data = response.json()
         assert data["total"] == 0
         assert data["jobs"] == []
 
-    def test_list_jobs(self, client, sample_job):
+    async def test_list_jobs(self, client, sample_job):
         """Test listing all jobs."""
-        response = client.get("/api/jobs")
+        response = await client.get("/api/jobs")
 
         assert response.status_code == 200
         data = response.json()
@@ -586,7 +541,7 @@ class TestJobEndpoints:
         assert len(data["jobs"]) == 1
         assert data["jobs"][0]["id"] == sample_job.id
 
-    def test_list_jobs_filter_by_status(
+    async def test_list_jobs_filter_by_status(
         self, client, db_session, sample_openai_secret, sample_keboola_secret
     ):
         """Test filtering jobs by status."""
@@ -601,6 +556,7 @@ class TestJobEndpoints:
             keboola_component_id="test-component",
             keboola_configuration_id="12345",
             status="active",
+            batches=[JobBatch(batch_id="batch_active", status="in_progress")],
         )
         paused_job = PollingJob(
             name="Paused Job",
@@ -610,27 +566,22 @@ class TestJobEndpoints:
             keboola_component_id="test-component",
             keboola_configuration_id="12345",
             status="paused",
+            batches=[JobBatch(batch_id="batch_paused", status="in_progress")],
         )
         db_session.add_all([active_job, paused_job])
-        db_session.flush()
-
-        # Add batches
-        active_batch = JobBatch(job_id=active_job.id, batch_id="batch_active", status="in_progress")
-        paused_batch = JobBatch(job_id=paused_job.id, batch_id="batch_paused", status="in_progress")
-        db_session.add_all([active_batch, paused_batch])
         db_session.commit()
 
         # Filter for active jobs only
-        response = client.get("/api/jobs?status=active")
+        response = await client.get("/api/jobs?status=active")
 
         assert response.status_code == 200
         data = response.json()
         assert data["total"] == 1
         assert data["jobs"][0]["status"] == "active"
 
-    def test_get_job_by_id(self, client, sample_job):
+    async def test_get_job_by_id(self, client, sample_job):
         """Test retrieving a specific job by ID."""
-        response = client.get(f"/api/jobs/{sample_job.id}")
+        response = await client.get(f"/api/jobs/{sample_job.id}")
 
         assert response.status_code == 200
         data = response.json()
@@ -640,7 +591,7 @@ class TestJobEndpoints:
         assert len(data["batches"]) > 0
         assert "logs" in data
 
-    def test_get_job_with_logs(self, client, db_session, sample_job):
+    async def test_get_job_with_logs(self, client, db_session, sample_job):
         """Test retrieving job with logs included."""
         # Create some log entries
         log1 = PollingLog(job_id=sample_job.id, status="checking", message="Checking batch status")
@@ -648,64 +599,65 @@ class TestJobEndpoints:
         db_session.add_all([log1, log2])
         db_session.commit()
 
-        response = client.get(f"/api/jobs/{sample_job.id}?include_logs=true")
+        response = await client.get(f"/api/jobs/{sample_job.id}?include_logs=true")
 
         assert response.status_code == 200
         data = response.json()
         assert len(data["logs"]) == 2
 
-    def test_get_job_without_logs(self, client, db_session, sample_job):
+    async def test_get_job_without_logs(self, client, db_session, sample_job):
         """Test retrieving job without logs."""
         # Create log entry
         log = PollingLog(job_id=sample_job.id, status="checking", message="Test log")
         db_session.add(log)
         db_session.commit()
 
-        response = client.get(f"/api/jobs/{sample_job.id}?include_logs=false")
+        response = await client.get(f"/api/jobs/{sample_job.id}?include_logs=false")
 
         assert response.status_code == 200
         data = response.json()
         assert len(data["logs"]) == 0
 
-    def test_get_job_log_limit(self, client, db_session, sample_job):
+    async def test_get_job_log_limit(self, client, db_session, sample_job):
         """Test log limit parameter."""
         # Create multiple log entries
-        for i in range(10):
-            log = PollingLog(job_id=sample_job.id, status="checking", message=f"Log {i}")
-            db_session.add(log)
+        db_session.add_all(
+            PollingLog(job_id=sample_job.id, status="checking", message=f"Log {i}")
+            for i in range(10)
+        )
         db_session.commit()
 
-        response = client.get(f"/api/jobs/{sample_job.id}?log_limit=5")
+        response = await client.get(f"/api/jobs/{sample_job.id}?log_limit=5")
 
         assert response.status_code == 200
         data = response.json()
         assert len(data["logs"]) == 5
 
-    def test_get_job_not_found(self, client):
+    async def test_get_job_not_found(self, client):
         """Test retrieving non-existent job."""
-        response = client.get("/api/jobs/99999")
+        response = await client.get("/api/jobs/99999")
 
         assert response.status_code == 404
         data = response.json()
         assert "not found" in data["detail"].lower()
         assert response.headers.get("X-Error-Code") == "1002"
 
-    def test_update_job(self, client, sample_job):
+    async def test_update_job(self, client, sample_job):
         """Test updating a job."""
         update_data = {"name": "Updated Job Name", "poll_interval_seconds": 300}
 
-        response = client.put(f"/api/jobs/{sample_job.id}", json=update_data)
+        response = await client.put(f"/api/jobs/{sample_job.id}", json=update_data)
 
         assert response.status_code == 200
         data = response.json()
         assert data["name"] == update_data["name"]
         assert data["poll_interval_seconds"] == update_data["poll_interval_seconds"]
 
-    def test_update_job_partial(self, client, sample_job):
+    async def test_update_job_partial(self, client, sample_job):
         """Test partial update of job."""
         update_data = {"name": "New Name Only"}
 
-        response = client.put(f"/api/jobs/{sample_job.id}", json=update_data)
+        response = await client.put(f"/api/jobs/{sample_job.id}", json=update_data)
 
         assert response.status_code == 200
         data = response.json()
@@ -713,19 +665,19 @@ class TestJobEndpoints:
         # Other fields should remain unchanged (batches should still exist)
         assert "batches" in data
 
-    def test_update_job_not_found(self, client):
+    async def test_update_job_not_found(self, client):
         """Test updating non-existent job."""
         update_data = {"name": "New Name"}
 
-        response = client.put("/api/jobs/99999", json=update_data)
+        response = await client.put("/api/jobs/99999", json=update_data)
 
         assert response.status_code == 404
 
-    def test_update_job_creates_log(self, client, db_session, sample_job):
+    async def test_update_job_creates_log(self, client, db_session, sample_job):
         """Test that updating job creates log entry."""
         update_data = {"name": "Updated Name"}
 
-        response = client.put(f"/api/jobs/{sample_job.id}", json=update_data)
+        response = await client.put(f"/api/jobs/{sample_job.id}", json=update_data)
         assert response.status_code == 200
 
         # Check for log entry
@@ -737,9 +689,9 @@ class TestJobEndpoints:
 
         assert log is not None
 
-    def test_delete_job(self, client, sample_job):
+    async def test_delete_job(self, client, sample_job):
         """Test deleting a job."""
-        response = client.delete(f"/api/jobs/{sample_job.id}")
+        response = await client.delete(f"/api/jobs/{sample_job.id}")
 
         assert response.status_code == 200
         data = response.json()
@@ -747,16 +699,16 @@ class TestJobEndpoints:
         assert "deleted successfully" in data["message"]
 
         # Verify job is deleted
-        get_response = client.get(f"/api/jobs/{sample_job.id}")
+        get_response = await client.get(f"/api/jobs/{sample_job.id}")
         assert get_response.status_code == 404
 
-    def test_delete_job_not_found(self, client):
+    async def test_delete_job_not_found(self, client):
         """Test deleting non-existent job."""
-        response = client.delete("/api/jobs/99999")
+        response = await client.delete("/api/jobs/99999")
 
         assert response.status_code == 404
 
-    def test_delete_job_cascades_to_logs(self, client, db_session, sample_job):
+    async def test_delete_job_cascades_to_logs(self, client, db_session, sample_job):
         """Test that deleting job also deletes associated logs."""
         # Create log entries
         log1 = PollingLog(job_id=sample_job.id, status="test", message="Log 1")
@@ -765,7 +717,7 @@ class TestJobEndpoints:
         db_session.commit()
 
         # Delete job
-        response = client.delete(f"/api/jobs/{sample_job.id}")
+        response = await client.delete(f"/api/jobs/{sample_job.id}")
         assert response.status_code == 200
 
         # Verify logs are deleted
@@ -780,22 +732,23 @@ class TestJobEndpoints:
 # ============================================================================
 
 
+@pytest.mark.asyncio
 class TestJobPauseResume:
     """Test cases for job pause and resume functionality."""
 
-    def test_pause_active_job(self, client, sample_job):
+    async def test_pause_active_job(self, client, sample_job):
         """Test pausing an active job."""
         assert sample_job.status == "active"
 
-        response = client.post(f"/api/jobs/{sample_job.id}/pause")
+        response = await client.post(f"/api/jobs/{sample_job.id}/pause")
 
         assert response.status_code == 200
         data = response.json()
         assert data["status"] == "paused"
 
-    def test_pause_job_creates_log(self, client, db_session, sample_job):
+    async def test_pause_job_creates_log(self, client, db_session, sample_job):
         """Test that pausing creates log entry."""
-        response = client.post(f"/api/jobs/{sample_job.id}/pause")
+        response = await client.post(f"/api/jobs/{sample_job.id}/pause")
         assert response.status_code == 200
 
         log = (
@@ -807,52 +760,52 @@ class TestJobPauseResume:
         assert log is not None
         assert "paused by user" in log.message.lower()
 
-    def test_pause_already_paused_job(self, client, db_session, sample_job):
+    async def test_pause_already_paused_job(self, client, db_session, sample_job):
         """Test pausing a job that is already paused."""
         # Pause the job first
         sample_job.status = "paused"
         db_session.commit()
 
-        response = client.post(f"/api/jobs/{sample_job.id}/pause")
+        response = await client.post(f"/api/jobs/{sample_job.id}/pause")
 
         assert response.status_code == 409
         data = response.json()
         assert "Cannot pause" in data["detail"]
 
-    def test_pause_completed_job(self, client, db_session, sample_job):
+    async def test_pause_completed_job(self, client, db_session, sample_job):
         """Test pausing a completed job fails."""
         sample_job.status = "completed"
         db_session.commit()
 
-        response = client.post(f"/api/jobs/{sample_job.id}/pause")
+        response = await client.post(f"/api/jobs/{sample_job.id}/pause")
 
         assert response.status_code == 409
 
-    def test_pause_job_not_found(self, client):
+    async def test_pause_job_not_found(self, client):
         """Test pausing non-existent job."""
-        response = client.post("/api/jobs/99999/pause")
+        response = await client.post("/api/jobs/99999/pause")
 
         assert response.status_code == 404
 
-    def test_resume_paused_job(self, client, db_session, sample_job):
+    async def test_resume_paused_job(self, client, db_session, sample_job):
         """Test resuming a paused job."""
         # Pause the job first
         sample_job.status = "paused"
         db_session.commit()
 
-        response = client.post(f"/api/jobs/{sample_job.id}/resume")
+        response = await client.post(f"/api/jobs/{sample_job.id}/resume")
 
         assert response.status_code == 200
         data = response.json()
         assert data["status"] == "active"
         assert data["next_check_at"] is not None
 
-    def test_resume_job_creates_log(self, client, db_session, sample_job):
+    async def test_resume_job_creates_log(self, client, db_session, sample_job):
         """Test that resuming creates log entry."""
         sample_job.status = "paused"
         db_session.commit()
 
-        response = client.post(f"/api/jobs/{sample_job.id}/resume")
+        response = await client.post(f"/api/jobs/{sample_job.id}/resume")
         assert response.status_code == 200
 
         log = (
@@ -864,34 +817,55 @@ class TestJobPauseResume:
         assert log is not None
         assert "resumed by user" in log.message.lower()
 
-    def test_resume_active_job(self, client, sample_job):
+    async def test_resume_job_resets_backoff(self, client, db_session, sample_job):
+        """Test that resuming restarts the idle backoff and keeps last_check_at."""
+        sample_job.status = "paused"
+        sample_job.last_check_at = datetime.now(timezone.utc) - timedelta(days=1)
+        sample_job.unchanged_checks = 3
+        db_session.commit()
+
+        response = await client.post(f"/api/jobs/{sample_job.id}/resume")
+
+        assert response.status_code == 200
+        assert response.json()["last_check_at"] is not None
+
+        db_session.refresh(sample_job)
+        assert sample_job.unchanged_checks == 0
+
+        # The first unchanged check after resume backs off one step, not to the cap
+        scheduler = JobScheduler(db_session)
+        next_check = scheduler.schedule_next_check(sample_job.id, backoff=True)
+        interval = (next_check - datetime.now(timezone.utc)).total_seconds()
+        assert interval == pytest.approx(2 * sample_job.poll_interval_seconds, abs=5)
+
+    async def test_resume_active_job(self, client, sample_job):
         """Test resuming an active job fails."""
         assert sample_job.status == "active"
 
-        response = client.post(f"/api/jobs/{sample_job.id}/resume")
+        response = await client.post(f"/api/jobs/{sample_job.id}/resume")
 
         assert response.status_code == 409
         data = response.json()
         assert "Cannot resume" in data["detail"]
 
-    def test_resume_job_not_found(self, client):
+    async def test_resume_job_not_found(self, client):
         """Test resuming non-existent job."""
-        response = client.post("/api/jobs/99999/resume")
+        response = await client.post("/api/jobs/99999/resume")
 
         assert response.status_code == 404
 
-    def test_pause_resume_cycle(self, client, db_session, sample_job):
+    async def test_pause_resume_cycle(self, client, db_session, sample_job):
         """Test full pause/resume cycle."""
         # Initial state: active
         assert sample_job.status == "active"
 
         # Pause
-        pause_response = client.post(f"/api/jobs/{sample_job.id}/pause")
+        pause_response = await client.post(f"/api/jobs/{sample_job.id}/pause")
         assert pause_response.status_code == 200
         assert pause_response.json()["status"] == "paused"
 
         # Resume
-        resume_response = client.post(f"/api/jobs/{sample_job.id}/resume")
+        resume_response = await client.post(f"/api/jobs/{sample_job.id}/resume")
         assert resume_response.status_code == 200
         assert resume_response.json()["status"] == "active"
 
@@ -901,13 +875,14 @@ class TestJobPauseResume:
 # ============================================================================
 
 
+@pytest.mark.asyncio
 class TestErrorHandling:
     """Test cases for error handling across all endpoints."""
 
-    def test_validation_error_format(self, client):
+    async def test_validation_error_format(self, client):
         """Test validation error response format."""
         # Send invalid data (missing required fields)
-        response = client.post("/api/admin/secrets", json={})
+        response = await client.post("/api/admin/secrets", json={})
 
         assert response.status_code == 422
         data = response.json()
@@ -915,9 +890,9 @@ class TestErrorHandling:
         assert "message" in data
         assert "details" in data
 
-    def test_validation_error_details(self, client):
+    async def test_validation_error_details(self, client):
         """Test validation error includes field details."""
-        response = client.post("/api/admin/secrets", json={"name": "test"})
+        response = await client.post("/api/admin/secrets", json={"name": "test"})
 
         assert response.status_code == 422
         data = response.json()
@@ -925,22 +900,22 @@ class TestErrorHandling:
         # Should include errors for missing fields
         assert len(data["details"]) > 0
 
-    def test_invalid_endpoint(self, client):
+    async def test_invalid_endpoint(self, client):
         """Test accessing non-existent endpoint."""
-        response = client.get("/api/nonexistent")
+        response = await client.get("/api/nonexistent")
 
         assert response.status_code == 404
 
-    def test_invalid_method(self, client):
+    async def test_invalid_method(self, client):
         """Test using invalid HTTP method."""
         # POST to endpoint that only accepts GET
-        response = client.post("/api/health")
+        response = await client.post("/api/health")
 
         assert response.status_code == 405  # Method Not Allowed
 
-    def test_malformed_json(self, client):
+    async def test_malformed_json(self, client):
         """Test sending malformed JSON."""
-        response = client.post(
+        response = await client.post(
             "/api/admin/secrets",
             content="not valid json",
             headers={"Content-Type": "application/json"},
@@ -948,9 +923,9 @@ class TestErrorHandling:
 
         assert response.status_code == 422
 
-    def test_invalid_id_type(self, client):
+    async def test_invalid_id_type(self, client):
         """Test using invalid ID type in URL."""
-        response = client.get("/api/jobs/not-a-number")
+        response = await client.get("/api/jobs/not-a-number")
 
         assert response.status_code == 422
 
@@ -960,12 +935,13 @@ class TestErrorHandling:
 # ============================================================================
 
 
+@pytest.mark.asyncio
 class TestResponseSchemas:
     """Test that API responses match Pydantic schemas."""
 
-    def test_secret_response_schema(self, client, sample_openai_secret):
+    async def test_secret_response_schema(self, client, sample_openai_secret):
         """Test secret response matches SecretResponse schema."""
-        response = client.get(f"/api/admin/secrets/{sample_openai_secret.id}")
+        response = await client.get(f"/api/admin/secrets/{sample_openai_secret.id}")
 
         assert response.status_code == 200
         data = response.json()
@@ -976,9 +952,9 @@ class TestResponseSchemas:
             assert field in data
             assert data[field] is not None
 
-    def test_secret_list_response_schema(self, client):
+    async def test_secret_list_response_schema(self, client):
         """Test secret list response matches SecretListResponse schema."""
-        response = client.get("/api/admin/secrets")
+        response = await client.get("/api/admin/secrets")
 
         assert response.status_code == 200
         data = response.json()
@@ -988,9 +964,9 @@ class TestResponseSchemas:
         assert isinstance(data["secrets"], list)
         assert isinstance(data["total"], int)
 
-    def test_job_response_schema(self, client, sample_job):
+    async def test_job_response_schema(self, client, sample_job):
         """Test job response matches PollingJobResponse schema."""
-        response = client.get(f"/api/jobs/{sample_job.id}")
+        response = await client.get(f"/api/jobs/{sample_job.id}")
 
         assert response.status_code == 200
         data = response.json()
@@ -1014,9 +990,9 @@ class TestResponseSchemas:
         for field in required_fields:
             assert field in data
 
-    def test_job_detail_response_schema(self, client, sample_job):
+    async def test_job_detail_response_schema(self, client, sample_job):
         """Test job detail response includes logs."""
-        response = client.get(f"/api/jobs/{sample_job.id}")
+        response = await client.get(f"/api/jobs/{sample_job.id}")
 
         assert response.status_code == 200
         data = response.json()
@@ -1024,9 +1000,9 @@ class TestResponseSchemas:
         assert "logs" in data
         assert isinstance(data["logs"], list)
 
-    def test_message_response_schema(self, client, sample_job):
+    async def test_message_response_schema(self, client, sample_job):
         """Test message response matches MessageResponse schema."""
-        response = client.delete(f"/api/jobs/{sample_job.id}")
+        response = await client.delete(f"/api/jobs/{sample_job.id}")
 
         assert response.status_code == 200
         data = response.json()
@@ -1035,9 +1011,9 @@ class TestResponseSchemas:
         assert "success" in data
         assert isinstance(data["success"], bool)
 
-    def test_health_response_schema(self, client):
+    async def test_health_response_schema(self, client):
         """Test health response matches HealthResponse schema."""
-        response = client.get("/api/health")
+        response = await client.get("/api/health")
 
         assert response.status_code == 200
         data = response.json()
@@ -1046,9 +1022,9 @@ class TestResponseSchemas:
         for field in required_fields:
             assert field in data
 
-    def test_stats_response_schema(self, client):
+    async def test_stats_response_schema(self, client):
         """Test stats response matches StatsResponse schema."""
-        response = client.get("/api/stats")
+        response = await client.get("/api/stats")
 
         assert response.status_code == 200
         data = response.json()
@@ -1072,10 +1048,11 @@ class TestResponseSchemas:
 # ============================================================================
 
 
+@pytest.mark.asyncio
 class TestEdgeCases:
     """Test edge cases and integration scenarios."""
 
-    def test_create_multiple_jobs_same_batch(
+    async def test_create_multiple_jobs_same_batch(
         self, client, sample_openai_secret, sample_keboola_secret
     ):
         """Test creating multiple jobs with the same batch_id."""
@@ -1099,14 +1076,16 @@ class TestEdgeCases:
             "keboola_configuration_id": "54321",
         }
 
-        response1 = client.post("/api/jobs", json=job_data_1)
-        response2 = client.post("/api/jobs", json=job_data_2)
+        response1 = await client.post("/api/jobs", json=job_data_1)
+        response2 = await client.post("/api/jobs", json=job_data_2)
 
         # Both should succeed (same batch_id is allowed in different jobs)
         assert response1.status_code == 201
         assert response2.status_code == 201
 
-    def test_job_with_very_long_names(self, client, sample_openai_secret, sample_keboola_secret):
+    async def test_job_with_very_long_names(
+        self, client, sample_openai_secret, sample_keboola_secret
+    ):
         """Test creating job with maximum length name."""
         job_data = {
             "name": "A" * 255,  # Max length
@@ -1118,10 +1097,12 @@ class TestEdgeCases:
             "keboola_configuration_id": "12345",
         }
 
-        response = client.post("/api/jobs", json=job_data)
+        response = await client.post("/api/jobs", json=job_data)
         assert response.status_code == 201
 
-    def test_job_with_min_poll_interval(self, client, sample_openai_secret, sample_keboola_secret):
+    async def test_job_with_min_poll_interval(
+        self, client, sample_openai_secret, sample_keboola_secret
+    ):
         """Test creating job with minimum poll interval."""
         job_data = {
             "name": "Min Interval Job",
@@ -1134,10 +1115,12 @@ class TestEdgeCases:
             "poll_interval_seconds": 30,  # Minimum allowed
         }
 
-        response = client.post("/api/jobs", json=job_data)
+        response = await client.post("/api/jobs", json=job_data)
         assert response.status_code == 201
 
-    def test_job_with_max_poll_interval(self, client, sample_openai_secret, sample_keboola_secret):
+    async def test_job_with_max_poll_interval(
+        self, client, sample_openai_secret, sample_keboola_secret
+    ):
         """Test creating job with maximum poll interval."""
         job_data = {
             "name": "Max Interval Job",
@@ -1150,20 +1133,20 @@ class TestEdgeCases:
             "poll_interval_seconds": 3600,  # Maximum allowed
         }
 
-        response = client.post("/api/jobs", json=job_data)
+        response = await client.post("/api/jobs", json=job_data)
         assert response.status_code == 201
 
-    def test_unicode_in_secret_name(self, client):
+    async def test_unicode_in_secret_name(self, client):
         """Test creating secret with Unicode characters in name."""
         secret_data = {"name": "test-secret-世界", "type": "openai", "value": "sk-test-key"}
 
-        response = client.post("/api/admin/secrets", json=secret_data)
+        response = await client.post("/api/admin/secrets", json=secret_data)
         assert response.status_code == 201
         assert response.json()["name"] == secret_data["name"]
 
-    def test_empty_stats_calculation(self, client):
+    async def test_empty_stats_calculation(self, client):
         """Test stats endpoint handles zero values correctly."""
-        response = client.get("/api/stats")
+        response = await client.get("/api/stats")
 
         assert response.status_code == 200
         data = response.json()
@@ -14,12 +14,8 @@ This module tests:
 import pytest
 from datetime import datetime, timedelta, timezone
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
 
 from app.main import app
-from app.database import get_db, Base
 from app.models import Secret, PollingJob, PollingLog, JobBatch
 from app.services.encryption import init_encryption_service
 
@@ -35,52 +31,18 @@ def encryption_key():
     return "test-secret-key-for-testing-purposes"
 
 
-@pytest.fixture(scope="function")
-def db_session(encryption_key):
-    """Create an in-memory SQLite database session for testing."""
-    # Initialize encryption service first
-    init_encryption_service(encryption_key)
-
-    # Create in-memory SQLite database with static pool
-    engine = create_engine(
-        "sqlite:///:memory:",
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,  # Use static pool for in-memory DB
-        echo=False,
-    )
-
-    # Create all tables
-    Base.metadata.create_all(bind=engine)
-
-    # Create session factory
-    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-    session = SessionLocal()
-
-    yield session
-
-    # Cleanup
-    session.close()
-    Base.metadata.drop_all(bind=engine)
-    engine.dispose()
+@pytest.fixture(autouse=True)
+def encryption_service(encryption_key):
+    """Initialize the encryption service for each test."""
+    return init_encryption_service(encryption_key)
 
 
 @pytest.fixture
-def client(db_session):
+def client(app_db_session):
     """Create a FastAPI test client with dependency override."""
-
-    def override_get_db():
-        try:
-            yield db_session
-        finally:
-            pass
-
-    app.dependency_overrides[get_db] = override_get_db
-
     with TestClient(app) as test_client:
         yield test_client
 
-    app.dependency_overrides.clear()
-
 
 @pytest.fixture
 def sample_openai_secret(db_session, encryption_key):
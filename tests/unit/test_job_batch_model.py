@@ -301,6 +301,28 @@ class TestJobBatchProperties:
 
         assert batch.is_failed is False
 
+    def test_batch_status_properties_in_queries(self, db_session, sample_job):
+        """Test is_terminal/is_completed/is_failed compile to SQL filters."""
+        for batch_id, status in [
+            ("batch_q_running", "in_progress"),
+            ("batch_q_done", "completed"),
+            ("batch_q_failed", "failed"),
+            ("batch_q_expired", "expired"),
+        ]:
+            db_session.add(JobBatch(job_id=sample_job.id, batch_id=batch_id, status=status))
+        db_session.commit()
+
+        def batch_ids(condition):
+            rows = db_session.query(JobBatch.batch_id).filter(condition).all()
+            return {row.batch_id for row in rows}
+
+        assert batch_ids(JobBatch.is_terminal) == {
+            "batch_q_done", "batch_q_failed", "batch_q_expired"
+        }
+        assert batch_ids(JobBatch.is_completed) == {"batch_q_done"}
+        assert batch_ids(JobBatch.is_failed) == {"batch_q_failed", "batch_q_expired"}
+        assert batch_ids(~JobBatch.is_terminal) == {"batch_q_running"}
+
 
 class TestPollingJobMultiBatchProperties:
     """Test cases for PollingJob multi-batch helper properties."""
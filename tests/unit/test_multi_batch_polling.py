@@ -3,7 +3,7 @@ Unit tests for multi-batch polling service refactored code.
 
 Tests the new multi-batch architecture:
 - _process_single_job: Handles multiple batches per job
-- _check_single_batch: Updates individual batch status
+- _fetch_batch_status / _apply_batch_statuses: Check and write individual batch status
 - _trigger_keboola_with_results: Passes batch metadata as parameters
 
 Test coverage targets 85%+ for polling.py lines 140-316.
@@ -14,7 +14,7 @@ import pytest
 from datetime import datetime, timezone
 from unittest.mock import Mock, AsyncMock, patch, call
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 
 from app.models import Secret, PollingJob, JobBatch, PollingLog, Base
@@ -381,6 +381,32 @@ class TestProcessSingleJob:
         db_session.refresh(job)
         assert job.status == "active"
 
+    async def test_process_job_failed_trigger_keeps_job_failed(
+        self,
+        polling_service,
+        multi_batch_job,
+        db_session
+    ):
+        """Test that a failed Keboola trigger is not overwritten by a completed status."""
+        with (
+            patch.object(polling_service, "_get_openai_client") as mock_get_openai,
+            patch.object(polling_service, "_get_keboola_client") as mock_get_keboola,
+        ):
+            mock_openai = AsyncMock()
+            mock_openai.check_batch_status = AsyncMock(
+                side_effect=lambda batch_id: {"status": "completed", "batch_id": batch_id}
+            )
+            mock_get_openai.return_value = mock_openai
+
+            mock_keboola = AsyncMock()
+            mock_keboola.trigger_job = AsyncMock(side_effect=Exception("Keboola API Error"))
+            mock_get_keboola.return_value = mock_keboola
+
+            await polling_service._process_single_job(multi_batch_job)
+
+        db_session.refresh(multi_batch_job)
+        assert multi_batch_job.status == "failed"
+
     async def test_process_job_all_already_terminal(
         self,
         polling_service,
@@ -407,23 +433,56 @@ class TestProcessSingleJob:
             # Should trigger Keboola even though no checks were needed
             mock_keboola.trigger_job.assert_called_once()
 
+            db_session.refresh(multi_batch_job)
+            assert multi_batch_job.status == "completed"
+            assert multi_batch_job.completed_at is not None
+
+    async def test_process_job_already_triggered_is_not_retriggered(
+        self,
+        polling_service,
+        multi_batch_job,
+        db_session
+    ):
+        """Test that a job whose Keboola trigger was logged is finished without re-triggering."""
+        for batch in multi_batch_job.batches:
+            batch.status = "completed"
+            batch.completed_at = datetime.now(timezone.utc)
+        db_session.add(PollingLog(
+            job_id=multi_batch_job.id,
+            status="keboola_triggered",
+            message="Action: keboola_triggered, Result: 987654",
+        ))
+        db_session.commit()
+        db_session.refresh(multi_batch_job)
+
+        with patch.object(polling_service, "_get_keboola_client") as mock_get_keboola:
+            mock_keboola = AsyncMock()
+            mock_get_keboola.return_value = mock_keboola
+
+            await polling_service._process_single_job(multi_batch_job)
+
+            mock_keboola.trigger_job.assert_not_called()
+
+        db_session.refresh(multi_batch_job)
+        assert multi_batch_job.status == "completed"
+
 
 # ============================================================================
-# Test Class 2: TestCheckSingleBatch
+# Test Class 2: TestFetchAndApplyBatchStatus
 # ============================================================================
 
 
 @pytest.mark.asyncio
-class TestCheckSingleBatch:
-    """Test _check_single_batch for individual batch status updates."""
+class TestFetchAndApplyBatchStatus:
+    """Test _fetch_batch_status and _apply_batch_statuses for individual batches."""
 
-    async def test_check_single_batch_status_update(
+    async def test_fetch_batch_status_update(
         self,
         polling_service,
         single_batch_job,
         db_session
     ):
-        """Test status changed - should update database."""
+        """Test status changed - fetched status is written to the database."""
         batch = single_batch_job.batches[0]
         assert batch.status == "in_progress"
 
@@ -433,22 +492,24 @@ class TestCheckSingleBatch:
             return_value={"status": "finalizing", "batch_id": batch.batch_id}
         )
 
-        # Check the batch
-        await polling_service._check_single_batch(mock_openai, batch)
+        new_status = await polling_service._fetch_batch_status(mock_openai, batch)
+        assert new_status == "finalizing"
+
+        polling_service._apply_batch_statuses(db_session, {batch.id: new_status})
+        db_session.commit()
 
-        # Verify status was updated
+        # Verify status was updated; non-terminal statuses have no completed_at
         db_session.refresh(batch)
         assert batch.status == "finalizing"
+        assert batch.completed_at is None
 
-    async def test_check_single_batch_no_change(
+    async def test_fetch_batch_status_no_change(
         self,
         polling_service,
         single_batch_job,
-        db_session
     ):
-        """Test status unchanged - should skip update."""
+        """Test status unchanged - fetched status equals the stored one."""
         batch = single_batch_job.batches[0]
-        original_status = batch.status
 
         # Mock OpenAI response with same status
         mock_openai = AsyncMock()
@@ -456,72 +517,58 @@ class TestCheckSingleBatch:
             return_value={"status": "in_progress", "batch_id": batch.batch_id}
         )
 
-        # Check the batch
-        await polling_service._check_single_batch(mock_openai, batch)
+        new_status = await polling_service._fetch_batch_status(mock_openai, batch)
 
-        # Status should remain unchanged
-        db_session.refresh(batch)
-        assert batch.status == original_status
-        assert batch.completed_at is None
+        assert new_status == batch.status
 
-    async def test_check_single_batch_terminal(
+    async def test_fetch_batch_status_uses_prefetched_result(
         self,
         polling_service,
         single_batch_job,
-        db_session
     ):
-        """Test terminal status - should set completed_at timestamp."""
+        """Test that an already fetched status skips the OpenAI call."""
         batch = single_batch_job.batches[0]
-
-        # Mock OpenAI response with terminal status
         mock_openai = AsyncMock()
-        mock_openai.check_batch_status = AsyncMock(
-            return_value={"status": "completed", "batch_id": batch.batch_id}
+
+        new_status = await polling_service._fetch_batch_status(
+            mock_openai, batch, {"status": "completed", "batch_id": batch.batch_id}
         )
 
-        # Check the batch
-        await polling_service._check_single_batch(mock_openai, batch)
+        assert new_status == "completed"
+        mock_openai.check_batch_status.assert_not_called()
 
-        # Verify status and timestamp
-        db_session.refresh(batch)
-        assert batch.status == "completed"
-        assert batch.completed_at is not None
-        assert batch.is_terminal is True
-
-    async def test_check_single_batch_failed_terminal(
+    @pytest.mark.parametrize(
+        "status, is_failed",
+        [("completed", False), ("failed", True), ("cancelled", True), ("expired", True)],
+    )
+    async def test_apply_terminal_status(
         self,
         polling_service,
         single_batch_job,
-        db_session
+        db_session,
+        status,
+        is_failed
     ):
-        """Test failed terminal status - should set completed_at."""
+        """Test terminal statuses - should set completed_at timestamp."""
         batch = single_batch_job.batches[0]
 
-        # Mock OpenAI response with failed status
-        mock_openai = AsyncMock()
-        mock_openai.check_batch_status = AsyncMock(
-            return_value={"status": "failed", "batch_id": batch.batch_id}
-        )
-
-        # Check the batch
-        await polling_service._check_single_batch(mock_openai, batch)
+        polling_service._apply_batch_statuses(db_session, {batch.id: status})
+        db_session.commit()
 
-        # Verify terminal status
         db_session.refresh(batch)
-        assert batch.status == "failed"
+        assert batch.status == status
         assert batch.completed_at is not None
         assert batch.is_terminal is True
-        assert batch.is_failed is True
+        assert batch.is_failed is is_failed
 
-    async def test_check_single_batch_error(
+    async def test_fetch_batch_status_error(
         self,
         polling_service,
         single_batch_job,
         db_session
     ):
-        """Test OpenAI error handling - should not crash."""
+        """Test OpenAI error handling - returns None and logs the error."""
         batch = single_batch_job.batches[0]
-        original_status = batch.status
 
         # Mock OpenAI to raise error
         mock_openai = AsyncMock()
@@ -530,55 +577,14 @@ class TestCheckSingleBatch:
         )
 
         # Should not raise error
-        await polling_service._check_single_batch(mock_openai, batch)
-
-        # Batch status should remain unchanged
-        db_session.refresh(batch)
-        assert batch.status == original_status
-
-    async def test_check_single_batch_cancelled(
-        self,
-        polling_service,
-        single_batch_job,
-        db_session
-    ):
-        """Test cancelled status - should be treated as terminal."""
-        batch = single_batch_job.batches[0]
+        new_status = await polling_service._fetch_batch_status(mock_openai, batch)
+        assert new_status is None
 
-        mock_openai = AsyncMock()
-        mock_openai.check_batch_status = AsyncMock(
-            return_value={"status": "cancelled", "batch_id": batch.batch_id}
-        )
-
-        await polling_service._check_single_batch(mock_openai, batch)
-
-        db_session.refresh(batch)
-        assert batch.status == "cancelled"
-        assert batch.is_terminal is True
-        assert batch.is_failed is True
-        assert batch.completed_at is not None
-
-    async def test_check_single_batch_expired(
-        self,
-        polling_service,
-        single_batch_job,
-        db_session
-    ):
-        """Test expired status - should be treated as terminal."""
-        batch = single_batch_job.batches[0]
-
-        mock_openai = AsyncMock()
-        mock_openai.check_batch_status = AsyncMock(
-            return_value={"status": "expired", "batch_id": batch.batch_id}
-        )
-
-        await polling_service._check_single_batch(mock_openai, batch)
-
-        db_session.refresh(batch)
-        assert batch.status == "expired"
-        assert batch.is_terminal is True
-        assert batch.is_failed is True
-        assert batch.completed_at is not None
+        log = db_session.query(PollingLog).filter(
+            PollingLog.job_id == single_batch_job.id, PollingLog.status == "error"
+        ).first()
+        assert log is not None
+        assert "API Error" in log.message
 
 
 # ============================================================================
@@ -955,6 +961,280 @@ class TestMultiBatchIntegration:
                 assert elapsed < 0.25, "Batch checks should be concurrent"
                 assert len(check_times) == 3
 
+    async def test_batch_statuses_written_in_one_update(
+        self,
+        polling_service,
+        multi_batch_job,
+        db_engine,
+        db_session
+    ):
+        """Test that changed batch statuses are written by a single UPDATE call."""
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            if statement.startswith("UPDATE job_batches"):
+                statements.append((statement, executemany))
+
+        async def mock_check_status(batch_id):
+            status = "in_progress" if batch_id == "batch_ghi789" else "completed"
+            return {"status": status, "batch_id": batch_id}
+
+        event.listen(db_engine, "before_cursor_execute", record)
+        try:
+            with patch.object(polling_service, "_get_openai_client") as mock_get_openai:
+                mock_openai = AsyncMock()
+                mock_openai.check_batch_status = AsyncMock(side_effect=mock_check_status)
+                mock_get_openai.return_value = mock_openai
+
+                with patch.object(polling_service, "_reschedule_job"):
+                    await polling_service._process_single_job(multi_batch_job)
+        finally:
+            event.remove(db_engine, "before_cursor_execute", record)
+
+        assert len(statements) == 1
+        assert statements[0][1] is True
+
+        db_session.expire_all()
+        batches = {b.batch_id: b for b in db_session.query(JobBatch).all()}
+        assert batches["batch_abc123"].status == "completed"
+        assert batches["batch_abc123"].completed_at is not None
+        assert batches["batch_ghi789"].status == "in_progress"
+        assert batches["batch_ghi789"].completed_at is None
+
+    async def test_batch_statuses_flushed_in_groups(
+        self,
+        polling_service,
+        multi_batch_job,
+        db_engine,
+        db_session
+    ):
+        """Test that status changes are written in groups of STATUS_FLUSH_SIZE."""
+        polling_service.STATUS_FLUSH_SIZE = 2
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            if statement.startswith("UPDATE job_batches"):
+                statements.append(len(parameters) if executemany else 1)
+
+        event.listen(db_engine, "before_cursor_execute", record)
+        try:
+            with patch.object(polling_service, "_get_openai_client") as mock_get_openai:
+                mock_openai = AsyncMock()
+                mock_openai.check_batch_status = AsyncMock(
+                    side_effect=lambda batch_id: {"status": "completed", "batch_id": batch_id}
+                )
+                mock_get_openai.return_value = mock_openai
+
+                with patch.object(polling_service, "_trigger_keboola_with_results"):
+                    await polling_service._process_single_job(multi_batch_job)
+        finally:
+            event.remove(db_engine, "before_cursor_execute", record)
+
+        assert statements == [2, 1]
+
+        db_session.expire_all()
+        assert all(b.status == "completed" for b in db_session.query(JobBatch).all())
+
+    async def test_listed_batches_skip_individual_checks(
+        self,
+        polling_service,
+        multi_batch_job,
+        db_session
+    ):
+        """Test that batches found by one list request are not retrieved individually."""
+        polling_service.LIST_MIN_BATCHES = 3
+
+        with patch.object(polling_service, "_get_openai_client") as mock_get_openai:
+            mock_openai = AsyncMock()
+            mock_openai.list_batch_statuses = AsyncMock(return_value={
+                "batch_abc123": {"status": "completed", "batch_id": "batch_abc123"},
+                "batch_def456": {"status": "failed", "batch_id": "batch_def456"},
+            })
+            mock_openai.check_batch_status = AsyncMock(
+                return_value={"status": "in_progress", "batch_id": "batch_ghi789"}
+            )
+            mock_get_openai.return_value = mock_openai
+
+            with patch.object(polling_service, "_reschedule_job"):
+                await polling_service._process_single_job(multi_batch_job)
+
+        assert mock_openai.list_batch_statuses.call_count == 1
+        mock_openai.check_batch_status.assert_called_once_with("batch_ghi789")
+
+        db_session.expire_all()
+        batches = {b.batch_id: b for b in db_session.query(JobBatch).all()}
+        assert batches["batch_abc123"].status == "completed"
+        assert batches["batch_def456"].status == "failed"
+        assert batches["batch_ghi789"].status == "in_progress"
+
+    async def test_batch_listing_shared_by_jobs_with_same_secret(
+        self,
+        polling_service,
+        multi_batch_job,
+        db_session
+    ):
+        """Test that jobs using the same OpenAI secret share one listing per cycle."""
+        polling_service.LIST_MIN_BATCHES = 3
+
+        second_job = PollingJob(
+            name="test-second-multi-batch-job",
+            openai_secret_id=multi_batch_job.openai_secret_id,
+            keboola_secret_id=multi_batch_job.keboola_secret_id,
+            keboola_stack_url="https://connection.keboola.com",
+            keboola_component_id="kds-team.app-custom-python",
+            keboola_configuration_id="12345",
+            poll_interval_seconds=120,
+            status="active",
+            next_check_at=datetime.now(timezone.utc),
+            batches=[
+                JobBatch(batch_id=f"batch_second_{i}", status="in_progress") for i in range(3)
+            ],
+        )
+        db_session.add(second_job)
+        db_session.commit()
+
+        listing = {
+            batch.batch_id: {"status": "in_progress", "batch_id": batch.batch_id}
+            for job in (multi_batch_job, second_job)
+            for batch in job.batches
+        }
+
+        with patch.object(polling_service, "_get_openai_client") as mock_get_openai:
+            mock_openai = AsyncMock()
+            mock_openai.list_batch_statuses = AsyncMock(return_value=listing)
+            mock_get_openai.return_value = mock_openai
+
+            with patch.object(polling_service, "_reschedule_job"):
+                await polling_service._process_jobs_concurrent([multi_batch_job, second_job])
+
+        assert mock_openai.list_batch_statuses.call_count == 1
+        mock_openai.check_batch_status.assert_not_called()
+
+    async def test_job_stops_listing_after_listing_misses_batches(
+        self,
+        polling_service,
+        multi_batch_job,
+    ):
+        """Test that batches missing from a listing are checked individually from then on."""
+        polling_service.LIST_MIN_BATCHES = 3
+
+        with patch.object(polling_service, "_get_openai_client") as mock_get_openai:
+            mock_openai = AsyncMock()
+            # Only unrelated, newer batches are in the listing
+            mock_openai.list_batch_statuses = AsyncMock(return_value={
+                "batch_newer": {"status": "in_progress", "batch_id": "batch_newer"},
+            })
+            mock_openai.check_batch_status = AsyncMock(
+                side_effect=lambda batch_id: {"status": "in_progress", "batch_id": batch_id}
+            )
+            mock_get_openai.return_value = mock_openai
+
+            with patch.object(polling_service, "_reschedule_job"):
+                await polling_service._process_jobs_concurrent([multi_batch_job])
+                await polling_service._process_jobs_concurrent([multi_batch_job])
+
+        # Listed once, then never again; every check fell back to a retrieve
+        assert mock_openai.list_batch_statuses.call_count == 1
+        assert mock_openai.check_batch_status.call_count == 6
+        assert multi_batch_job.id in polling_service._unlisted_jobs
+
+    async def test_inactive_jobs_pruned_from_unlisted_jobs(
+        self,
+        polling_service,
+        multi_batch_job,
+        single_batch_job,
+        db_session
+    ):
+        """Test that jobs leaving the active set get another listing attempt."""
+        polling_service._unlisted_jobs.update({multi_batch_job.id, single_batch_job.id, 99999})
+
+        multi_batch_job.status = "paused"
+        db_session.commit()
+
+        polling_service._prune_unlisted_jobs(db_session)
+
+        assert polling_service._unlisted_jobs == {single_batch_job.id}
+
+    async def test_few_pending_batches_are_not_listed(
+        self,
+        polling_service,
+        multi_batch_job,
+    ):
+        """Test that jobs below LIST_MIN_BATCHES retrieve their batches directly."""
+        with patch.object(polling_service, "_get_openai_client") as mock_get_openai:
+            mock_openai = AsyncMock()
+            mock_openai.check_batch_status = AsyncMock(
+                side_effect=lambda batch_id: {"status": "in_progress", "batch_id": batch_id}
+            )
+            mock_get_openai.return_value = mock_openai
+
+            with patch.object(polling_service, "_reschedule_job"):
+                await polling_service._process_single_job(multi_batch_job)
+
+        mock_openai.list_batch_statuses.assert_not_called()
+        assert mock_openai.check_batch_status.call_count == 3
+
+    async def test_batch_checks_bounded_by_max_concurrent_checks(
+        self,
+        polling_service,
+        multi_batch_job,
+    ):
+        """Test that batch checks never exceed max_concurrent_checks in flight."""
+        polling_service.max_concurrent_checks = 2
+        in_flight = 0
+        peak = 0
+
+        async def mock_check_status(batch_id):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"status": "in_progress", "batch_id": batch_id}
+
+        with patch.object(polling_service, "_get_openai_client") as mock_get_openai:
+            mock_openai = AsyncMock()
+            mock_openai.check_batch_status = AsyncMock(side_effect=mock_check_status)
+            mock_get_openai.return_value = mock_openai
+
+            with patch.object(polling_service, "_reschedule_job"):
+                await polling_service._process_single_job(multi_batch_job)
+
+        assert mock_openai.check_batch_status.call_count == 3
+        assert peak == 2
+
+    async def test_batch_checks_bounded_across_jobs(
+        self,
+        polling_service,
+        multi_batch_job,
+        single_batch_job,
+    ):
+        """Test that concurrent jobs share one max_concurrent_checks budget."""
+        polling_service.max_concurrent_checks = 2
+        in_flight = 0
+        peak = 0
+
+        async def mock_check_status(batch_id):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"status": "in_progress", "batch_id": batch_id}
+
+        with patch.object(polling_service, "_get_openai_client") as mock_get_openai:
+            mock_openai = AsyncMock()
+            mock_openai.check_batch_status = AsyncMock(side_effect=mock_check_status)
+            mock_get_openai.return_value = mock_openai
+
+            with patch.object(polling_service, "_reschedule_job"):
+                await polling_service._process_jobs_concurrent(
+                    [multi_batch_job, single_batch_job]
+                )
+
+        assert mock_openai.check_batch_status.call_count == 4
+        assert peak == 2
+
     async def test_error_in_one_batch_does_not_affect_others(
         self,
         polling_service,
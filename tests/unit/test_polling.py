@@ -469,12 +469,9 @@ class TestPollingServiceErrorHandling:
             # Process the job (should not raise)
             await polling_service._process_single_job(sample_job)
 
-            # Job ends up as "completed" because the status is set in line 201
-            # AFTER _trigger_keboola_with_results catches its exception.
-            # The "failed" status set inside _trigger_keboola_with_results (line 314)
-            # gets overwritten by line 201-203.
+            # The "failed" status set by _trigger_keboola_with_results is kept
             db_session.refresh(sample_job)
-            assert sample_job.status == "completed"
+            assert sample_job.status == "failed"
 
     async def test_handle_job_error_logs_and_reschedules(
         self, polling_service, sample_job, db_session
@@ -593,11 +590,28 @@ class TestPollingServiceClientManagement:
         assert len(polling_service._openai_clients) > 0
         assert len(polling_service._keboola_clients) > 0
 
+        session = polling_service._http_session
+        assert session is not None
+
         # Cleanup
         await polling_service._cleanup_clients()
 
         assert len(polling_service._openai_clients) == 0
         assert len(polling_service._keboola_clients) == 0
+        assert session.closed
+        assert polling_service._http_session is None
+
+    async def test_keboola_clients_share_http_session(self, polling_service, sample_job):
+        """Test that Keboola clients for different secrets reuse one HTTP session."""
+        client_a = await polling_service._get_keboola_client(sample_job)
+        polling_service._keboola_clients.clear()
+        client_b = await polling_service._get_keboola_client(sample_job)
+
+        assert client_a is not client_b
+        assert client_a._get_session() is client_b._get_session()
+        assert client_a._get_session() is polling_service._http_session
+
+        await polling_service._cleanup_clients()
 
 
 # ============================================================================
@@ -849,6 +863,57 @@ class TestPollingServiceBatchCompletion:
         assert sample_job.next_check_at != initial_next_check
         assert next_check_aware > datetime.now(timezone.utc)
 
+    async def test_reschedule_job_backoff(self, polling_service, sample_job, db_session):
+        """Test that unchanged checks double the interval up to the cap and reset after."""
+
+        def current_interval():
+            db_session.refresh(sample_job)
+            return (sample_job.next_check_at - sample_job.last_check_at).total_seconds()
+
+        await polling_service._reschedule_job(sample_job)
+        assert current_interval() == pytest.approx(120, abs=1)
+
+        intervals = []
+        for _ in range(4):
+            await polling_service._reschedule_job(sample_job, backoff=True)
+            intervals.append(current_interval())
+        assert intervals == pytest.approx([240, 480, 960, 960], abs=1)
+        assert sample_job.unchanged_checks == 4
+
+        await polling_service._reschedule_job(sample_job)
+        assert current_interval() == pytest.approx(120, abs=1)
+        assert sample_job.unchanged_checks == 0
+
+    async def test_unchanged_checks_back_off(self, polling_service, sample_job):
+        """Test that a successful check finding no change asks for a backoff."""
+        with (
+            patch.object(polling_service, "_get_openai_client") as mock_get_client,
+            patch.object(polling_service, "_reschedule_job") as mock_reschedule,
+        ):
+            mock_client = AsyncMock()
+            mock_client.check_batch_status = AsyncMock(
+                return_value={"status": "in_progress", "batch_id": "batch_test123"}
+            )
+            mock_get_client.return_value = mock_client
+
+            await polling_service._process_single_job(sample_job)
+
+        mock_reschedule.assert_called_once_with(sample_job, backoff=True)
+
+    async def test_failed_checks_do_not_back_off(self, polling_service, sample_job):
+        """Test that a cycle where every check failed is not treated as unchanged."""
+        with (
+            patch.object(polling_service, "_get_openai_client") as mock_get_client,
+            patch.object(polling_service, "_reschedule_job") as mock_reschedule,
+        ):
+            mock_client = AsyncMock()
+            mock_client.check_batch_status = AsyncMock(side_effect=Exception("API Error"))
+            mock_get_client.return_value = mock_client
+
+            await polling_service._process_single_job(sample_job)
+
+        mock_reschedule.assert_called_once_with(sample_job, backoff=False)
+
 
 # ============================================================================
 # Test PollingService - Polling Loop
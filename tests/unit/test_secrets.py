@@ -340,6 +340,21 @@ class TestSecretManager:
         result = secret_manager.get_secret_by_id(created.id)
         assert result is None
 
+    def test_create_and_delete_without_commit(self, secret_manager, sample_secret_data, db_session):
+        """Test that commit=False leaves the transaction to the caller."""
+        created = secret_manager.create_secret(sample_secret_data, commit=False)
+        assert created.id is not None
+        assert secret_manager.get_secret_by_id(created.id) is not None
+
+        # Nothing was committed, so rolling back discards the secret
+        db_session.rollback()
+        assert secret_manager.get_secret_by_id(created.id) is None
+
+        created = secret_manager.create_secret(sample_secret_data, commit=False)
+        secret_manager.delete_secret(created.id, commit=False)
+        db_session.commit()
+        assert secret_manager.get_secret_by_id(created.id) is None
+
     def test_delete_secret_not_found(self, secret_manager):
         """Test deleting non-existent secret."""
         with pytest.raises(SecretNotFoundError):